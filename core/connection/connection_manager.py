@@ -5,7 +5,8 @@ Elle s'appuie sur la dataclass Connection pour représenter chaque lien
 """
 import logging
 
-from typing import List, Set, Tuple, Dict, Any
+from collections import deque
+from typing import List, Optional, Set, Tuple, Dict, Any
 from .connection import Connection
 
 from core.connection.connection_visualizer import ConnectionVisualizer
@@ -19,10 +20,13 @@ class ConnectionManager:
 
     _connections: List[Connection]
     _nodes: Set[str]
+    _execution_order: Optional[List[str]]
 
     def __init__(self):
         self._connections = []
         self._nodes = set()
+        # Ordre topologique mémorisé, invalidé à chaque ajout de connexion
+        self._execution_order = None
 
     def add_connection(self, 
                        source_id: str, 
@@ -52,6 +56,7 @@ class ConnectionManager:
         self._connections.append(conn)
         self._nodes.add(source_id)
         self._nodes.add(target_id)
+        self._execution_order = None
 
         logger.debug(f"Connexion ajoutée : {conn}")
 
@@ -108,6 +113,12 @@ class ConnectionManager:
         Raises:
             ValueError si cycle détecté (hors recyclage)
         """
+        if self._execution_order is None:
+            self._execution_order = self._compute_execution_order()
+        return list(self._execution_order)
+
+    def _compute_execution_order(self) -> List[str]:
+        """Tri topologique du graphe hors recyclages (voir get_execution_order)"""
         non_recycle_edges = {}
         in_degree = {node: 0 for node in self._nodes}
 
@@ -120,12 +131,12 @@ class ConnectionManager:
 
                 in_degree[conn.target_id] += 1
         
-        queue = [node for node, degree in in_degree.items() if degree == 0]
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
 
         order = []
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             order.append(current)
 
             for neighbor in non_recycle_edges.get(current, []):
@@ -134,7 +145,8 @@ class ConnectionManager:
                     queue.append(neighbor)
 
         if len(order) != len(self._nodes):
-            raise ValueError("Cycle détecté dans le graphe (hors recyclage)."
+            remaining = sorted(node for node, degree in in_degree.items() if degree > 0)
+            raise ValueError(f"Cycle détecté dans le graphe (hors recyclage) : {remaining!r}. "
                              "Marquez les recyclages avec is_recycle=True")
         
         logger.debug(f"Ordre d'exécution calculé : {'->'.join(order)}")
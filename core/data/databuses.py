@@ -25,7 +25,7 @@ class DataBus:
             value (Any): Valeur à stocker
         """
         self._data_store[key] = value
-        self.logger.debug(f"DataBus: Ecriture '{key}'")
+        self.logger.debug("DataBus: Ecriture '%s'", key)
     
     def read(self, key:str, default: Any = None) -> Any:
         """
@@ -45,13 +45,15 @@ class DataBus:
         """
         Ecrit les données d'un flux pour un noeud donné
 
+        Le FlowData n'est pas modifié : le noeud source est porté par la clé
+        du bus, ce qui permet de partager la même instance avec SimulationFlow.
+
         Args:
             node_id (str): ID du noeud source
             flow_data (FlowData): Données du flux
         """
-        flow_data.source_node = node_id
         self._flow_store[node_id] = flow_data
-        self.logger.debug(f"DataBus: Flux écrit pour noeud '{node_id}' (modèle: {flow_data.model_type})")
+        self.logger.debug("DataBus: Flux écrit pour noeud '%s' (modèle: %s)", node_id, flow_data.model_type)
 
     def read_flow(self, node_id: str) -> Optional[FlowData]:
         """
@@ -1,16 +1,21 @@
 import logging
+import operator
 
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field, asdict
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class FlowData:
     """
     Représente les données d'un flux à un instant donné
     Structure flexible pour supporter différents modèles
+
+    Les attributs sont en slots : pas de __dict__ par instance, l'historique
+    d'une simulation en contient des milliers.
     """
     timestamp: datetime
     flowrate: float # m^3/h
@@ -37,7 +42,9 @@ class FlowData:
     source_node: Optional[str] = None
     model_type: Optional[str] = None
 
-    _STANDARD_KEYS = {'tss', 'cod', 'bod', 'tkn', 'nh4', 'no3', 'po4', 'alkalinity'}
+    _MEASURED_KEYS = ('tss', 'cod', 'bod', 'tkn', 'nh4', 'no3', 'po4', 'alkalinity')
+    _MEASURED_GET = operator.attrgetter(*_MEASURED_KEYS)
+    _STANDARD_KEYS = frozenset(_MEASURED_KEYS)
 
     def get(self, key: str, default: float = 0.0) -> float:
         """
@@ -68,6 +75,15 @@ class FlowData:
         else:
             self.components[key] = value
 
+    @property
+    def components_readonly(self) -> Mapping[str, float]:
+        """Vue en lecture seule sur les composants (aucune copie)"""
+        return MappingProxyType(self.components)
+
+    def mutable_components(self) -> Dict[str, float]:
+        """Copie modifiable des composants, à utiliser avant toute écriture"""
+        return dict(self.components)
+
     def has_model_components(self) -> bool:
         """Vérifie si le flux contient des composants de modèles"""
         return len(self.components) > 0
@@ -79,11 +95,13 @@ class FlowData:
         Returns:
             Dict[str, float]: Dictionnaire complet des composants
         """
-        return {**{k: getattr(self, k) for k in self._STANDARD_KEYS}, **self.components}
+        all_components = dict(zip(self._MEASURED_KEYS, self._MEASURED_GET(self)))
+        all_components.update(self.components)
+        return all_components
     
     def extract_measured(self, keys: Optional[list[str]] = None) -> Dict[str, float]:
         if keys is None:
-            keys = ['tss', 'cod', 'bod', 'tkn', 'nh4', 'no3', 'po4', 'alkalinity']
+            return dict(zip(self._MEASURED_KEYS, self._MEASURED_GET(self)))
         return {k: self.get(k, 0.0) for k in keys}
     
     def to_dict(self) -> Dict[str, Any]:
@@ -91,10 +109,25 @@ class FlowData:
         Convertit en dictionnaire.
         Les métriques opérationnelles sont aplaties au niveau racine (rétrocompatibilité).
         """
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        # Aplatir metrics au niveau racine et supprimer la clé imbriquée
-        data.update(data.pop('metrics', {}))
+        # Construction explicite : évite la récursion générique de dataclasses.asdict
+        data = {
+            'timestamp': self.timestamp.isoformat(),
+            'flowrate': self.flowrate,
+            'temperature': self.temperature,
+            'tss': self.tss,
+            'cod': self.cod,
+            'bod': self.bod,
+            'tkn': self.tkn,
+            'nh4': self.nh4,
+            'no3': self.no3,
+            'po4': self.po4,
+            'alkalinity': self.alkalinity,
+            'components': dict(self.components),
+            'source_node': self.source_node,
+            'model_type': self.model_type
+        }
+        # Aplatir metrics au niveau racine
+        data.update(self.metrics)
         return data
     
     def copy(self) -> 'FlowData':
@@ -104,7 +137,23 @@ class FlowData:
         Returns:
             FlowData: Instance de FlowData
         """
-        return FlowData(**asdict(self))
+        return FlowData(
+            timestamp=self.timestamp,
+            flowrate=self.flowrate,
+            temperature=self.temperature,
+            tss=self.tss,
+            cod=self.cod,
+            bod=self.bod,
+            tkn=self.tkn,
+            nh4=self.nh4,
+            no3=self.no3,
+            po4=self.po4,
+            alkalinity=self.alkalinity,
+            components=dict(self.components),
+            metrics=dict(self.metrics),
+            source_node=self.source_node,
+            model_type=self.model_type
+        )
     
     def __post_init__(self):
         """Valide les données après initialisation"""
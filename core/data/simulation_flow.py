@@ -1,6 +1,8 @@
 import logging
 
-from typing import Dict, Any, List, Optional
+import numpy as np
+
+from typing import Dict, Any, List, Optional, Tuple
 from core.data.flow_data import FlowData
 
 class SimulationFlow:
@@ -9,9 +11,24 @@ class SimulationFlow:
     Permet de tracer l'évolution temporelle des paramètres
     """
 
-    def __init__(self):
+    def __init__(self, max_history: Optional[int] = None):
+        """
+        Args:
+            max_history (Optional[int]): Si défini, l'historique exposé se limite aux
+                max_history derniers pas de chaque noeud ; les sommes cumulées couvrent
+                toujours toute la simulation. None : tout garder
+        """
+        if max_history is not None and (
+            isinstance(max_history, bool) or not isinstance(max_history, int) or max_history < 1
+        ):
+            raise ValueError(f"max_history doit être un entier >= 1, reçu : {max_history!r}")
         self.logger = logging.getLogger(__name__)
+        self.max_history = max_history
         self._history: Dict[str, List[FlowData]] = {}
+        # Sommes cumulées par noeud (n, débit, DCO, énergie), tenues à jour dans add_flow
+        self._running: Dict[str, Dict[str, float]] = {}
+        # Colonnes mémorisées : (node_id, clés) → (tampon (capacité, k), vue (n, k))
+        self._columns: Dict[Tuple[str, Tuple[str, ...]], Tuple[np.ndarray, np.ndarray]] = {}
 
     def add_flow(self, node_id: str, flow_data: FlowData) -> None:
         """
@@ -21,8 +38,45 @@ class SimulationFlow:
             node_id (str): ID du noeud
             flow_data (FlowData): Données à ajouter
         """
-        self._history.setdefault(node_id, []).append(flow_data)
-        self.logger.debug(f"SimulationFlow : Ajout pour '{node_id}' à {flow_data.timestamp}")
+        self._append(node_id, flow_data)
+        self.logger.debug("SimulationFlow : Ajout pour '%s' à %s", node_id, flow_data.timestamp)
+
+    def add_flows(self, flows: Dict[str, FlowData]) -> None:
+        """
+        Ajoute en une fois les flux produits par plusieurs noeuds (un pas de temps)
+
+        Args:
+            flows (Dict[str, FlowData]): {node_id: FlowData}
+        """
+        for node_id, flow_data in flows.items():
+            self._append(node_id, flow_data)
+        self.logger.debug("SimulationFlow : Ajout de %d flux", len(flows))
+
+    def _append(self, node_id: str, flow_data: FlowData) -> None:
+        """Ajoute un flux à l'historique et met à jour les sommes cumulées"""
+        history = self._history.setdefault(node_id, [])
+        history.append(flow_data)
+        # Troncature par blocs : coût amorti O(1) par ajout. Jusqu'à
+        # 2*max_history - 1 flux sont gardés en interne ; les lectures n'en
+        # exposent que les max_history derniers (_window)
+        if self.max_history is not None and len(history) >= 2 * self.max_history:
+            del history[:-self.max_history]
+            for key in [k for k in self._columns if k[0] == node_id]:
+                del self._columns[key]
+
+        running = self._running.get(node_id)
+        if running is None:
+            running = self._running[node_id] = {'n': 0, 'flowrate': 0.0, 'cod': 0.0, 'energy': 0.0}
+        running['n'] += 1
+        running['flowrate'] += flow_data.flowrate
+        running['cod'] += flow_data.cod
+        running['energy'] += flow_data.get('aeration_energy_kwh', 0.0)
+
+    def _window(self, rows):
+        """Derniers max_history éléments de rows (tous si l'historique n'est pas borné)"""
+        if self.max_history is None:
+            return rows
+        return rows[-self.max_history:]
 
     def get_history(self, node_id: str) -> List[FlowData]:
         """
@@ -34,7 +88,7 @@ class SimulationFlow:
         Returns:
             List[FlowData]: Liste chronologique des FlowData
         """
-        return self._history.get(node_id, []).copy()
+        return list(self._window(self._history.get(node_id, [])))
     
     def get_all_histories(self) -> Dict[str, List[FlowData]]:
         """
@@ -43,7 +97,7 @@ class SimulationFlow:
         Returns:
             Dict[str, List[FlowData]]
         """
-        return {k: v.copy() for k, v in self._history.items()}
+        return {k: list(self._window(v)) for k, v in self._history.items()}
     
     def get_latest(self, node_id: str) -> Optional[FlowData]:
         """
@@ -58,11 +112,67 @@ class SimulationFlow:
         history = self._history.get(node_id, [])
         return history[-1] if history else None
     
+    def get_columns(self, node_id: str, keys: Tuple[str, ...]) -> np.ndarray:
+        """
+        Vue colonnes (SoA) de l'historique d'un noeud
+
+        Extrait les grandeurs demandées en un seul passage ; le tableau est
+        mémorisé tant qu'aucun flux n'est ajouté au noeud. Les colonnes sont
+        stockées dans un tampon dont la capacité double : après un ajout, seules
+        les nouvelles lignes sont extraites.
+
+        Args:
+            node_id (str): ID du noeud
+            keys (Tuple[str, ...]): Grandeurs à extraire (FlowData.get)
+
+        Returns:
+            np.ndarray: Tableau (n_pas, len(keys)) en lecture seule, limité aux
+                max_history derniers pas si l'historique est borné
+        """
+        history = self._history.get(node_id, [])
+        n = len(history)
+        cache_key = (node_id, keys)
+        cached = self._columns.get(cache_key)
+        start = 0
+        if cached is not None:
+            buffer, view = cached
+            if len(view) == n:
+                return self._window(view)
+            if len(view) < n:
+                start = len(view)
+        if start == 0:
+            buffer = np.empty((max(n, 16), len(keys)), dtype=float)
+        elif n > len(buffer):
+            grown = np.empty((max(n, 2 * len(buffer)), len(keys)), dtype=float)
+            grown[:start] = buffer[:start]
+            buffer = grown
+
+        for i in range(start, n):
+            flow = history[i]
+            buffer[i] = [flow.get(key, 0.0) for key in keys]
+
+        # Vue en lecture seule ; le tampon reste modifiable pour les ajouts suivants
+        view = buffer[:n]
+        view.flags.writeable = False
+        self._columns[cache_key] = (buffer, view)
+        return self._window(view)
+
+    def get_running_totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        Retourne les sommes cumulées par noeud
+
+        Returns:
+            Dict[str, Dict[str, float]]: {node_id: {'n', 'flowrate', 'cod', 'energy'}}
+        """
+        return {k: v.copy() for k, v in self._running.items()}
+
     def clear(self) -> None:
         """
         Vide l'historique
         """
         self._history.clear()
+        self._running.clear()
+        self._columns.clear()
         self.logger.info("SimulationFlow vidé")
 
     def export_to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -73,5 +183,6 @@ class SimulationFlow:
             Dict[str, List[Dict[str, Any]]]: Dictionnaire avec les historiques sérialisés
         """
         return {
-            node_id: [flow.to_dict() for flow in flows] for node_id, flows in self._history.items()
+            node_id: [flow.to_dict() for flow in self._window(flows)]
+            for node_id, flows in self._history.items()
         }
\ No newline at end of file
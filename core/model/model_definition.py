@@ -1,14 +1,22 @@
 import logging
+import sys
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Type
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Type
 from importlib import import_module
 
 from core.model.model_parameter import ModelParameter
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@lru_cache(maxsize=None)
+def _resolve_class(module: str, class_name: str) -> Type:
+    """Importe une classe, mémorisé pour toutes les définitions (et registres)"""
+    return getattr(import_module(module), class_name)
+
+@dataclass(slots=True)
 class ModelDefinition:
     """Définition complète d'un model"""
     id: str
@@ -27,6 +35,23 @@ class ModelDefinition:
 
     _class_cache: Optional[Type] = field(default=None, repr=False)
 
+    # Vues précalculées (colonnes) pour les requêtes répétées
+    _component_ids: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _components_by_id: Mapping[str, str] = field(init=False, repr=False, compare=False)
+    _param_ids: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _param_defaults: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _param_dict: Dict[str, ModelParameter] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._component_ids = tuple(sys.intern(c.get('id', 'Inconnu')) for c in self.components)
+        self._components_by_id = MappingProxyType({
+            component_id: c.get('name', 'Inconnu')
+            for component_id, c in zip(self._component_ids, self.components)
+        })
+        self._param_ids = tuple(p.id for p in self.parameters)
+        self._param_defaults = tuple(p.default for p in self.parameters)
+        self._param_dict = dict(zip(self._param_ids, self.parameters))
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ModelDefinition':
         """Crée une ModelDefinition depuis un dictionnaire"""
@@ -35,7 +60,7 @@ class ModelDefinition:
             type=data['type'],
             name=data['name'],
             description=data['description'],
-            category=data['category'],
+            category=data.get('category', ''),
             components_count=data['components_count'],
             processes_count=data['processes_count'],
             default_temperature=data['default_temperature'],
@@ -50,9 +75,8 @@ class ModelDefinition:
         """Importe et retourne la classe du modèle"""
         if self._class_cache is None:
             try:
-                module = import_module(self.module)
-                self._class_cache = getattr(module, self.class_name)
-                logger.debug(f"Classe modèle chargée : {self.module}.{self.class_name}")
+                self._class_cache = _resolve_class(self.module, self.class_name)
+                logger.debug("Classe modèle chargée : %s.%s", self.module, self.class_name)
             except (ImportError, AttributeError) as e:
                 raise ImportError(
                     f"Impossible de charger {self.class_name} depuis {self.module} : {e}"
@@ -62,15 +86,16 @@ class ModelDefinition:
     
     def get_param_dict(self) -> Dict[str, ModelParameter]:
         """Retourne les paramètres sous forme d'un dictionnaire"""
-        return {p.id: p for p in self.parameters}
+        return self._param_dict.copy()
     def get_default_params(self) -> Dict[str, float]:
         """Retourne les valeurs par défaut des paramètres du modèle"""
-        return {p.id: p.default for p in self.parameters}
+        return dict(zip(self._param_ids, self._param_defaults))
     def get_components_names(self) -> List[str]:
         """Retourne la liste des noms de composants du modèle"""
-        return [c.get('id', 'Inconnu') for c in self.components]
-    def get_components_dict(self) -> Dict[str, str]:
-        return {c.get('id', 'Inconnu'): c.get('name', 'Inconnu') for c in self.components}
+        return list(self._component_ids)
+    def get_components_dict(self) -> Mapping[str, str]:
+        """Retourne la correspondance id → nom des composants (lecture seule)"""
+        return self._components_by_id
     
     def get_metrics_dict(self) -> Dict[str, Any]:
         return self.metrics
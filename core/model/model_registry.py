@@ -3,18 +3,20 @@ Registre centralisé des models disponibles
 
 Ce module charge dynamiquement les procédés depuis un fichier json et gère leur instanciation
 """
-import json
 import logging
+import threading
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Type
+from typing import Dict, Any, List, Optional, Tuple, Type
 
 from core.model.model_definition import ModelDefinition
+from utils.json_utils import load_json_cached, read_json_cached, read_definition_cached
 
 logger = logging.getLogger(__name__)
 
 class ModelRegistry:
     _instance = None
+    _lock = threading.Lock()
 
     def __init__(self, catalog_path: Optional[Path]) -> None:
         if catalog_path is None:
@@ -24,6 +26,14 @@ class ModelRegistry:
         self.models: Dict[str, ModelDefinition] = {}
         self.categories: Dict[str, Dict[str, str]] = {}
 
+        # Fichier source (chemin, mtime) des modèles pas encore convertis en ModelDefinition
+        self._sources: Dict[str, Tuple[Path, int]] = {}
+        self._types: List[str] = []
+        # Types de modèles par catégorie, dans l'ordre du catalogue
+        self._by_category: Dict[str, List[str]] = {}
+        # Format CLI mémorisé : le catalogue ne change qu'au chargement
+        self._cli_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
         self._load_catalog()
 
     def _load_catalog(self) -> None:
@@ -32,15 +42,13 @@ class ModelRegistry:
             raise FileNotFoundError(
                 f"Catalogue de modèles introuvable : {self.catalog_path}"
             )
-        
-        index_path = self.catalog_path / 'index.json'
-        with open(index_path, 'r', encoding='utf-8') as f:
-            index = json.load(f)
+        self._cli_cache = None
+
+        index = load_json_cached(self.catalog_path / 'index.json')
 
         categories_path = self.catalog_path / 'categories.json'
         if categories_path.exists():
-            with open(categories_path, 'r', encoding='utf-8') as f:
-                self.categories = json.load(f)
+            self.categories = dict(load_json_cached(categories_path))
 
         for entry in index.get('models', []):
             model_path = self.catalog_path / entry['path']
@@ -49,33 +57,46 @@ class ModelRegistry:
                 logger.warning(f"Fichier modèle introuvable : {model_path}")
                 continue
 
-            with open(model_path, 'r', encoding='utf-8') as f:
-                model_data = json.load(f)
+            mtime_ns = model_path.stat().st_mtime_ns
+            model_data = read_json_cached(model_path, mtime_ns)
+            model_type = model_data['type']
+            if model_type not in self._sources:
+                self._types.append(model_type)
+                self._by_category.setdefault(model_data.get('category', ''), []).append(model_type)
+            self._sources[model_type] = (model_path, mtime_ns)
 
-            definition = ModelDefinition.from_dict(model_data)
-            self.models[definition.type] = definition
-
-            logger.debug(
-                f"Modèle chargé : {definition.type} ({model_path})"
-            )
-        logger.info(f"{len(self.models)} modèles chargés")
+            logger.debug("Modèle indexé : %s (%s)", model_type, model_path)
+        logger.info("%s modèles chargés", len(self._types))
 
     @classmethod
     def get_instance(cls, catalog_path: Optional[Path] = None) -> 'ModelRegistry':
-        """Retourne l'instance du registre"""
-        if cls._instance is None:
-            cls._instance = cls(catalog_path)
-        return cls._instance
+        """Retourne l'instance du registre (verrou uniquement à la création)"""
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls(catalog_path)
+            return cls._instance
     
     def get_model_definition(self, model_type: str) -> ModelDefinition:
         """Récupère la définition d'un modèle"""
-        if model_type not in self.models:
-            available = ', '.join(self.models.keys())
-            raise ValueError(
-                f"Type de modèle inconnu : '{model_type}'. "
-                f"Type disponibles : {available}"
-            )
-        return self.models[model_type]
+        definition = self.models.get(model_type)
+        if definition is None:
+            if model_type not in self._sources:
+                available = ', '.join(self._types)
+                raise ValueError(
+                    f"Type de modèle inconnu : '{model_type}'. "
+                    f"Type disponibles : {available}"
+                )
+            definition = read_definition_cached(ModelDefinition.from_dict, *self._sources[model_type])
+            self.models[model_type] = definition
+            logger.debug("Modèle chargé : %s", definition.type)
+        return definition
+
+    def _all_definitions(self) -> List[ModelDefinition]:
+        """Retourne toutes les définitions dans l'ordre du catalogue"""
+        return [self.get_model_definition(t) for t in self._types]
     
     def create_model(
             self,
@@ -108,15 +129,15 @@ class ModelRegistry:
         if model_path and hasattr(instance, 'load'):
             try:
                 instance.load(str(model_path))
-                logger.info(f"Modèle ML chargé depuis : {model_path}")
+                logger.info("Modèle ML chargé depuis : %s", model_path)
             except Exception as e:
                 logger.warning(f"Impossible de charger le modèle depuis {model_path} : {e}")
 
-        logger.info(f"Modèle instancié : {definition.name} ({model_type})")
+        logger.info("Modèle instancié : %s (%s)", definition.name, model_type)
         return instance
     
     def list_models(self, category: Optional[str] = None) -> List[ModelDefinition]:
-        models = list(self.models.values())
+        models = self._all_definitions()
 
         if category:
             models = [m for m in models if m.category == category]
@@ -125,32 +146,37 @@ class ModelRegistry:
     
     def get_model_types(self) -> List[str]:
         """Retourne la lsite des types de modèles disponibles"""
-        return list(self.models.keys())
+        return list(self._types)
     
-    def get_mechanistric_models(self) -> List[str]:
+    def get_mechanistic_models(self) -> List[str]:
         """Retourne uniquement les modèles mécanistes"""
-        return [
-            model_type for model_type, definition in self.models.items()
-            if definition.category == 'empirical'
-        ]
+        return list(self._by_category.get('empirical', ()))
+
+    # Ancien nom (faute de frappe) conservé pour compatibilité
+    get_mechanistric_models = get_mechanistic_models
     
     def get_ml_models(self) -> List[str]:
         """Retourne uniquement les modèles ML"""
-        return [
-            model_type for model_type, definition in self.models.items()
-            if definition.category == 'machine_learning'
-        ]
+        return list(self._by_category.get('machine_learning', ()))
     
     def to_cli_format(self) -> Dict[str, Dict[str, Any]]:
         """
         Convertit le registre au format attendu par CLIInterface
 
+        Le résultat est mémorisé et partagé : il ne doit pas être modifié.
+
         Returns:
             Dict[str, Dict[str, Any]]: Dict compabile avec l'affichage CLI
         """
+        if self._cli_cache is None:
+            self._cli_cache = self._build_cli_format()
+        return self._cli_cache
+
+    def _build_cli_format(self) -> Dict[str, Dict[str, Any]]:
+        """Construit le format CLI à partir des définitions du catalogue"""
         cli_format = {}
 
-        for i, (model_type, definition) in enumerate(self.models.items(), 1):
+        for i, definition in enumerate(self._all_definitions(), 1):
             cli_format[str(i)] = {
                 'type': definition.type,
                 'name': definition.name,
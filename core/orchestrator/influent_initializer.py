@@ -1,24 +1,131 @@
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, FrozenSet, Iterable, Optional, Tuple, Union
 from datetime import datetime
 from core.data.flow_data import FlowData
+from core.model.model_registry import ModelRegistry
+from core.process.process_registry import ProcessRegistry
 
-class InfluentInitializer:
-    @staticmethod
-    def create_from_config(config: Dict[str, Any], current_time: datetime) -> 'FlowData':
+_COMPOSITION_KEYS = ('cod', 'tkn', 'bod', 'nh4', 'no3', 'po4', 'alkalinity')
+_MEASURED_KEYS = frozenset(_COMPOSITION_KEYS + ('tss',))
+# Modèle supposé quand la config ne décrit aucun procédé (spécification isolée) :
+# celui du bassin de boues activées par défaut
+_DEFAULT_MODEL = 'ASM1Model'
+
+
+def _process_model_type(proc: Dict[str, Any], process_registry: ProcessRegistry) -> Optional[str]:
+    """
+    Modèle effectivement utilisé par un procédé de la config
+
+    Même résolution que ProcessRegistry.create_process : 'model' de la config du
+    procédé, sinon le défaut du paramètre 'model' de sa définition, sinon le
+    modèle fixe de la définition (TakacsModel pour le décanteur).
+    """
+    model_type = proc.get('config', {}).get('model')
+    if model_type:
+        return model_type
+    try:
+        definition = process_registry.get_process_definition(proc.get('type'))
+    except ValueError:
+        return None  # type inconnu : signalé à la création du procédé
+    return definition.get_default_config().get('model') or definition.model or None
+
+
+def _target_model_components(config: Dict[str, Any]) -> FrozenSet[str]:
+    """Composants des modèles utilisés par les procédés de la config"""
+    processes = config.get('processes', [])
+    if processes:
+        process_registry = ProcessRegistry.get_instance()
+        model_types = {_process_model_type(proc, process_registry) for proc in processes}
+        model_types.discard(None)
+    else:
+        model_types = {_DEFAULT_MODEL}
+
+    registry = ModelRegistry.get_instance()
+    components = set()
+    for model_type in model_types:
+        try:
+            components.update(registry.get_model_definition(model_type).get_components_names())
+        except ValueError:
+            continue  # modèle inconnu : signalé à la création du procédé
+    return frozenset(components)
+
+@dataclass(frozen=True, slots=True)
+class InfluentSpec:
+    """Description de l'influent, extraite une seule fois de la config"""
+    flowrate: float
+    temperature: float
+    composition: Tuple[Tuple[str, float], ...]
+    # Composants de modèle fournis tels quels (auto_fractionate=False)
+    components: Tuple[Tuple[str, float], ...] = ()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Dict[str, Any],
+        model_components: Optional[Iterable[str]] = None
+    ) -> 'InfluentSpec':
         """
-        Crée le FlowData initial de l'influent à partir de la config
+        Construit la spécification depuis la config de simulation
+
+        'ss' reste l'alias de 'tss' quand 'tss' n'est pas fourni. Avec
+        auto_fractionate=False, les clés de la composition qui appartiennent au
+        jeu de composants du modèle cible sont reprises telles quelles comme
+        composants du flux (le fractionnement est alors court-circuité dans les
+        ProcessNode) ; les autres clés sont ignorées.
+
+        Args:
+            config (Dict[str, Any]): Config de simulation
+            model_components (Optional[Iterable[str]]): Composants du modèle cible ;
+                par défaut ceux des modèles des procédés de la config
         """
         influent_config = config.get('influent', {})
         composition = influent_config.get('composition', {})
 
-        flow = FlowData(
-            timestamp=current_time,
+        values = tuple((attr, composition.get(attr, 0.0)) for attr in _COMPOSITION_KEYS)
+        tss = composition.get('tss', composition.get('ss', 0.0))
+
+        components: Tuple[Tuple[str, float], ...] = ()
+        if not influent_config.get('auto_fractionate', True):
+            if model_components is None:
+                model_components = _target_model_components(config)
+            allowed = frozenset(model_components) - _MEASURED_KEYS
+            if 'tss' not in composition:
+                allowed -= {'ss'}  # 'ss' a déjà servi d'alias de 'tss'
+            components = tuple(
+                (key, value) for key, value in composition.items() if key in allowed
+            )
+        return cls(
             flowrate=influent_config.get('flowrate', 1000.0),
             temperature=influent_config.get('temperature', 20.0),
-            source_node='influent'
+            composition=values + (('tss', tss),),
+            components=components
+        )
+
+class InfluentInitializer:
+    @staticmethod
+    def create(spec: InfluentSpec, current_time: datetime) -> FlowData:
+        """
+        Crée le FlowData de l'influent à partir d'une spécification déjà extraite
+        """
+        flow = FlowData(
+            timestamp=current_time,
+            flowrate=spec.flowrate,
+            temperature=spec.temperature,
+            source_node='influent',
+            components=dict(spec.components)
         )
+        # Affectés après construction : valeurs configurées gardées telles quelles
+        # (pas de remise à zéro des négatifs par __post_init__)
+        for attr, value in spec.composition:
+            setattr(flow, attr, value)
+        return flow
 
-        for attr in ('cod', 'tkn', 'bod', 'nh4', 'no3', 'po4', 'alkalinity'):
-            setattr(flow, attr, composition.get(attr, 0.0))
-        flow.tss = composition.get('tss', composition.get('ss', 0.0))
-        return flow
\ No newline at end of file
+    @staticmethod
+    def create_from_config(config: Union[Dict[str, Any], InfluentSpec], current_time: datetime) -> 'FlowData':
+        """
+        Crée le FlowData initial de l'influent à partir de la config
+
+        Accepte aussi une InfluentSpec déjà construite (évite de relire la config).
+        """
+        spec = config if isinstance(config, InfluentSpec) else InfluentSpec.from_config(config)
+        return InfluentInitializer.create(spec, current_time)
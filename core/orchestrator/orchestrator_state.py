@@ -1,21 +1,71 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+@lru_cache(maxsize=128)
+def _parse_time(value: str) -> datetime:
+    """fromisoformat mémorisé : les balayages réutilisent les mêmes bornes"""
+    return datetime.fromisoformat(value)
+
+@dataclass(frozen=True, slots=True)
+class SimulationConfig:
+    """Bornes temporelles de la simulation, extraites une seule fois de la config"""
+    start_time: datetime
+    end_time: datetime
+    timestep_hours: float
+    timestep_td: timedelta
+    # Nombre de pas d'historique conservés par noeud (None : historique complet)
+    history_max_steps: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'SimulationConfig':
+        sim_config = config.get('simulation', {})
+        timestep_hours = sim_config.get('timestep_hours', 0.1)
+        history_max_steps = sim_config.get('history_max_steps')
+        if history_max_steps is not None and (
+            isinstance(history_max_steps, bool)
+            or not isinstance(history_max_steps, int)
+            or history_max_steps < 1
+        ):
+            raise ValueError(
+                f"simulation.history_max_steps doit être un entier >= 1, reçu : {history_max_steps!r}"
+            )
+        return cls(
+            start_time=_parse_time(sim_config.get('start_time')),
+            end_time=_parse_time(sim_config.get('end_time')),
+            timestep_hours=timestep_hours,
+            timestep_td=timedelta(hours=timestep_hours),
+            history_max_steps=history_max_steps
+        )
 
 class OrchestratorState:
     def __init__(self, start_time: datetime, end_time: datetime, timestep_hours: float) -> None:
         self.start_time = start_time
         self.end_time = end_time
         self.timestep = timestep_hours
-        self.current_time = start_time
         self.current_step = 0
+        self._timestep_td = timedelta(hours=timestep_hours)
+
+    @property
+    def current_time(self) -> datetime:
+        """Instant courant, dérivé du numéro de pas (calculé à la demande)"""
+        return self.start_time + self.current_step * self._timestep_td
 
     def advance(self):
         """Passe au pas de temps suivant"""
-        self.current_time += timedelta(hours=self.timestep)
         self.current_step += 1
 
+    def remaining_steps(self) -> int:
+        """Nombre de pas à exécuter tant que current_time < end_time"""
+        remaining = self.end_time - self.current_time
+        if remaining <= timedelta(0):
+            return 0
+        return -(-remaining // self._timestep_td)
+
     @property
     def total_steps(self) -> int:
         return int((self.end_time - self.start_time).total_seconds() / 3600 / self.timestep)
 
     def progress_percent(self) -> float:
-        return (self.current_step / self.total_steps) * 100
\ No newline at end of file
+        return (self.current_step / self.total_steps) * 100
@@ -1,11 +1,107 @@
-import json
+import threading
 import numpy as np
 
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from core.data.simulation_flow import SimulationFlow
 from core.data.flow_data import FlowData
+from utils.json_utils import dumps as _dumps, dumps_line as _dumps_line, loads as _loads
+
+_HISTORY_FORMATS = ('json', 'ndjson')
+
+
+_writer: Optional[ThreadPoolExecutor] = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> ThreadPoolExecutor:
+    """Thread unique d'écriture des résultats, créé au premier save_async"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='result-writer')
+    return _writer
+
+
+def _write_files(files: List[Tuple[Path, Iterable[bytes]]]) -> Path:
+    """Écrit les fichiers (contenu en morceaux) et retourne le premier chemin"""
+    for path, chunks in files:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.writelines(chunks)
+    return files[0][0]
+
+
+def _iter_json(data: Dict[str, Any], encoded: Optional[Dict[str, bytes]] = None) -> Iterator[bytes]:
+    """
+    Encode data comme _dumps, mais historique noeud par noeud
+
+    Le contenu produit est identique à _dumps(data) ; seul l'historique d'un
+    noeud est encodé en mémoire à la fois. Les sections déjà présentes dans
+    encoded (sorties de _dumps) ne sont pas ré-encodées.
+    """
+    encoded = encoded or {}
+    yield b'{'
+    for i, (key, value) in enumerate(data.items()):
+        yield (b',\n  ' if i else b'\n  ') + _dumps(key) + b': '
+        if key in encoded:
+            yield encoded[key].replace(b'\n', b'\n  ')
+        elif key == 'history' and value:
+            for j, (node_id, rows) in enumerate(value.items()):
+                # Les chaînes JSON n'ont pas de saut de ligne brut : ré-indentation sûre
+                yield (b',\n    ' if j else b'{\n    ') + _dumps(node_id) + b': ' \
+                    + _dumps(rows).replace(b'\n', b'\n    ')
+            yield b'\n  }'
+        else:
+            yield _dumps(value).replace(b'\n', b'\n  ')
+    yield b'\n}' if data else b'}'
+
+
+# Sections communes au fichier complet et au résumé, encodées une seule fois
+_SUMMARY_SECTIONS = ('metadata', 'statistics', 'summary')
+
+# Grandeurs agrégées par noeud de procédé, dans l'ordre des colonnes extraites
+_STAT_KEYS = (
+    'cod_soluble', 'soluble_cod_removal', 'biomass_concentration',
+    'srt_days', 'aeration_energy_kwh', 'energy_per_m3'
+)
+
+
+# Seuils d'abattement (%) et classes correspondantes, par ordre croissant
+_EFFICIENCY_THRESHOLDS = (70, 80, 90, 95)
+_EFFICIENCY_LABELS = ("Insuffisant", "Moyen", "Bon", "Très bon", "Excellent")
+
+
+@lru_cache(maxsize=1024)
+def _operation_status(mlss: float, svi: float, srt: float) -> str:
+    """Diagnostic opérationnel ; mémorisé, les états stationnaires se répètent"""
+    issues = []
+
+    if mlss < 1500:
+        issues.append("MLSS faible")
+    elif mlss > 5000:
+        issues.append("MLSS élevé")
+
+    if svi > 200:
+        issues.append("Mauvaise décantabilité")
+
+    if srt < 3:
+        issues.append("SRT trop court")
+    elif srt > 30:
+        issues.append("SRT très élevé")
+
+    if not issues:
+        return "Optimal"
+    elif len(issues) == 1:
+        return f"Attention : {issues[0]}"
+    else:
+        return f"Problèmes : {', '.join(issues)}"
+
 
 class ResultManager:
     def __init__(self, simulation_flow: SimulationFlow) -> None:
@@ -30,38 +126,43 @@ class ResultManager:
             Dict[str, Any]: Dictionnaire de statistiques
         """
         stats = {}
+        totals = self.simulation_flow.get_running_totals()
         for nid, history in self.simulation_flow.get_all_histories().items():
-            if not history:
+            running = totals.get(nid)
+            if not history or not running:
                 continue
+            n = running['n']
             stats[nid] = {
-                'num_samples': len(history),
-                'avg_flowrate': sum(f.flowrate for f in history) / len(history),
-                'avg_cod': sum(f.get('cod', 0.0) for f in history) / len(history)
+                'num_samples': n,
+                'avg_flowrate': running['flowrate'] / n,
+                'avg_cod': running['cod'] / n
             }
 
             if nid != 'influent':
-                cod_soluble_values = [f.get('cod_soluble', 0) for f in history]
-                cod_removal_values = [f.get('soluble_cod_removal', 0) for f in history]
-                biomass_values = [f.get('biomass_concentration', 0) for f in history]
-                srt_values = [f.get('srt_days', 0) for f in history if f.get('srt_days', 0) < float('inf')]
+                table = self.simulation_flow.get_columns(nid, _STAT_KEYS)
+                avg = table.mean(axis=0)
+                low = table.min(axis=0)
+                high = table.max(axis=0)
+                srt_values = table[:, 3]
+                srt_values = srt_values[srt_values < np.inf]
 
                 stats[nid].update({
-                    'avg_cod_soluble': np.mean(cod_soluble_values) if cod_soluble_values else 0,
-                    'min_cod_soluble': np.min(cod_soluble_values) if cod_soluble_values else 0,
-                    'max_cod_soluble': np.max(cod_soluble_values) if cod_soluble_values else 0,
+                    'avg_cod_soluble': avg[0],
+                    'min_cod_soluble': low[0],
+                    'max_cod_soluble': high[0],
 
-                    'avg_cod_removal': np.mean(cod_removal_values) if cod_removal_values else 0,
-                    'min_cod_removal': np.min(cod_removal_values) if cod_removal_values else 0,
-                    'max_cod_removal': np.max(cod_removal_values) if cod_removal_values else 0,
+                    'avg_cod_removal': avg[1],
+                    'min_cod_removal': low[1],
+                    'max_cod_removal': high[1],
 
-                    'avg_biomass': np.mean(biomass_values) if biomass_values else 0,
-                    'min_biomass': np.min(biomass_values) if biomass_values else 0,
-                    'max_biomass': np.max(biomass_values) if biomass_values else 0,
+                    'avg_biomass': avg[2],
+                    'min_biomass': low[2],
+                    'max_biomass': high[2],
 
-                    'avg_srt_days': np.mean(srt_values) if srt_values else 0,
+                    'avg_srt_days': srt_values.mean() if srt_values.size else 0,
 
-                    'total_energy_kwh': sum(f.get('aeration_energy_kwh', 0) for f in history),
-                    'avg_energy_per_m3': np.mean([f.get('energy_per_m3', 0) for f in history])
+                    'total_energy_kwh': running['energy'],
+                    'avg_energy_per_m3': avg[5]
                 })
 
         return stats
@@ -77,6 +178,7 @@ class ResultManager:
         }
 
         histories = self.simulation_flow.get_all_histories()
+        totals = self.simulation_flow.get_running_totals()
 
         for nid, history in histories.items():
             if nid == 'influent' or not history:
@@ -103,8 +205,10 @@ class ResultManager:
                 'operational_status': self._classify_operation(final)
             }
 
-            total_energy = sum(f.get('aeration_energy_kwh', 0) for f in history)
-            total_volume = sum(f.get('flowrate', 0)*(1/60) for f in history)
+            # Sommes tenues à jour à chaque ajout : pas de nouveau parcours de l'historique
+            running = totals[nid]
+            total_energy = running['energy']
+            total_volume = running['flowrate'] * (1/60)
 
             summary['economic'][nid] = {
                 'total_energy_kwh': total_energy,
@@ -118,69 +222,110 @@ class ResultManager:
 
     def _classify_efficiency(self, removal_rate: float) -> str:
         """Classifie l'efficacité du traitement"""
-        if removal_rate >= 95:
-            return "Excellent"
-        elif removal_rate >= 90:
-            return "Très bon"
-        elif removal_rate >= 80:
-            return "Bon"
-        elif removal_rate >= 70:
-            return "Moyen"
-        else:
-            return "Insuffisant"
+        if removal_rate != removal_rate:  # NaN : bisect le classerait en tête
+            return _EFFICIENCY_LABELS[0]
+        return _EFFICIENCY_LABELS[bisect_right(_EFFICIENCY_THRESHOLDS, removal_rate)]
         
     def _classify_operation(self, data: FlowData) -> str:
         """Evalue l'état opérationnel"""
-        issues = []
-
-        mlss = data.get('tss', 0)
-        if mlss < 1500:
-            issues.append("MLSS faible")
-        elif mlss > 5000:
-            issues.append("MLSS élevé")
-
-        svi = data.get('svi', 0)
-        if svi > 200:
-            issues.append("Mauvaise décantabilité")
-
-        srt = data.get('srt_days', 0)
-        if srt < 3:
-            issues.append("SRT trop court")
-        elif srt > 30:
-            issues.append("SRT très élevé")
-
-        if not issues:
-            return "Optimal"
-        elif len(issues) == 1:
-            return f"Attention : {issues[0]}"
-        else:
-            return f"Problèmes : {', '.join(issues)}"
+        return _operation_status(data.get('tss', 0), data.get('svi', 0), data.get('srt_days', 0))
 
-    def save(self, output_dir: str) -> Path:
+    def serialize(self, output_dir: str, history_format: str = 'json') -> List[Tuple[Path, bytes]]:
+        """
+        Sérialise les résultats sans écrire sur disque
+
+        Args:
+            output_dir (str): Répertoire de sortie
+            history_format (str): 'json' (historique dans le fichier complet) ou
+                'ndjson' (un fichier par noeud, une ligne par pas de temps)
+
+        Returns:
+            List[Tuple[Path, bytes]]: (chemin, contenu) ; résultats complets, résumé,
+            puis historiques par noeud en ndjson
+        """
+        return [(path, b''.join(chunks)) for path, chunks in self._file_chunks(output_dir, history_format)]
+
+    def _file_chunks(self, output_dir: str, history_format: str) -> List[Tuple[Path, Iterable[bytes]]]:
+        """Fichiers à écrire, contenu encodé à la demande (morceau par morceau)"""
+        if history_format not in _HISTORY_FORMATS:
+            raise ValueError(
+                f"Format d'historique inconnu : '{history_format}'. "
+                f"Formats disponibles : {', '.join(_HISTORY_FORMATS)}"
+            )
+        output_path = Path(output_dir)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        summary_data = {key: self.results[key] for key in _SUMMARY_SECTIONS}
+        encoded = {key: _dumps(value) for key, value in summary_data.items()}
+
+        history_files: List[Tuple[Path, Iterable[bytes]]] = []
+        full_data = self.results
+        if history_format == 'ndjson':
+            history_dir = f"simulation_{timestamp}_history"
+            full_data = {k: v for k, v in self.results.items() if k != 'history'}
+            full_data['history_files'] = {}
+            for node_id, rows in self.results['history'].items():
+                relative = f"{history_dir}/{node_id}.ndjson"
+                full_data['history_files'][node_id] = relative
+                history_files.append(
+                    (output_path / relative, (_dumps_line(row) + b'\n' for row in rows))
+                )
+
+        return [
+            (output_path / f"simulation_{timestamp}_full.json", _iter_json(full_data, encoded)),
+            (output_path / f"simulation_{timestamp}_summary.json", _iter_json(summary_data, encoded)),
+            *history_files
+        ]
+
+    def save(self, output_dir: str, history_format: str = 'json') -> Path:
         """
         Sauvegarde les résultats de la simulation
 
+        L'historique est encodé et écrit noeud par noeud : le fichier complet
+        n'est jamais entièrement en mémoire.
+
         Args:
             output_dir (str): Répertoire de sortie
+            history_format (str): 'json' ou 'ndjson' (voir serialize)
 
         Returns:
             Path: Chemin du fichier de résultats
         """
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        return _write_files(self._file_chunks(output_dir, history_format))
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"simulation_{timestamp}.json"
-        filepath = output_path/filename
-        with open(filepath, 'w') as f:
-            json.dump(self.results, f, indent=2, default=str)
-
-        summary_file = output_path / f"simulation_{timestamp}_summary.json"
-        with open(summary_file, 'w') as f:
-            summary_data = {
-                'metadata': self.results['metadata'],
-                'statistics': self.results['statistics'],
-                'summary': self.results['summary']
-            }
-            json.dump(summary_data, f, indent=2, default=str)
-        return filepath
\ No newline at end of file
+    def save_async(self, output_dir: str, history_format: str = 'json') -> 'Future[Path]':
+        """
+        Sauvegarde les résultats en arrière-plan
+
+        La sérialisation est faite immédiatement (instantané des résultats),
+        seule l'écriture disque est déléguée au thread d'écriture.
+
+        Args:
+            output_dir (str): Répertoire de sortie
+            history_format (str): 'json' ou 'ndjson' (voir serialize)
+
+        Returns:
+            Future[Path]: Chemin du fichier de résultats une fois écrit
+        """
+        files = [(path, (payload,)) for path, payload in self.serialize(output_dir, history_format)]
+        return _get_writer().submit(_write_files, files)
+
+    @staticmethod
+    def load_history(results_file: Path) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Relit les historiques d'un fichier de résultats, quel que soit le format
+
+        Args:
+            results_file (Path): Fichier complet retourné par save
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: {node_id: [pas de temps sérialisés]}
+        """
+        results_file = Path(results_file)
+        data = _loads(results_file.read_bytes())
+        if 'history' in data:
+            return data['history']
+        return {
+            node_id: [_loads(line) for line in (results_file.parent / relative).read_bytes().splitlines() if line]
+            for node_id, relative in data.get('history_files', {}).items()
+        }
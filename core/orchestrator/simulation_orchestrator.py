@@ -1,38 +1,47 @@
 import logging
 
-from datetime import datetime
-from typing import Dict, Any, List, Tuple
+from itertools import pairwise
+from typing import Dict, Any, List, Optional, Tuple
 
 from core.data.databuses import DataBus
+from core.data.flow_data import FlowData
 from core.data.simulation_flow import SimulationFlow
 from core.process.process_node import ProcessNode
-from core.orchestrator.orchestrator_state import OrchestratorState
+from core.orchestrator.orchestrator_state import OrchestratorState, SimulationConfig
 from core.orchestrator.result_manager import ResultManager
-from core.orchestrator.influent_initializer import InfluentInitializer
+from core.orchestrator.influent_initializer import InfluentInitializer, InfluentSpec
 from core.connection.connection_manager import ConnectionManager
 from core.connection.connection import Connection
 
+# Clés des outputs de procédé qui ne sont ni des composants ni des métriques
+_STRUCTURAL_KEYS = frozenset({'components', 'underflow', 'flowrate', 'temperature', 'model_type'})
+# Paramètres mesurés recopiés des outputs vers les attributs du FlowData
+_OUTPUT_MEASURED_KEYS = ('cod', 'tss', 'bod', 'tkn', 'nh4', 'no3', 'po4')
+
 class SimulationOrchestrator:
     """Cerveau du simulateur - coordination entre procédés et flux"""
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        sim_config = config.get('simulation', {})
+        self.sim_config = SimulationConfig.from_config(config)
         self.logger = logging.getLogger(f"{__name__}.{config.get('name','sim')}")
 
         self.state = OrchestratorState(
-            start_time=datetime.fromisoformat(sim_config.get('start_time')),
-            end_time=datetime.fromisoformat(sim_config.get('end_time')),
-            timestep_hours=sim_config.get('timestep_hours', 0.1)
+            start_time=self.sim_config.start_time,
+            end_time=self.sim_config.end_time,
+            timestep_hours=self.sim_config.timestep_hours
         )
+        self.influent_spec = InfluentSpec.from_config(config)
         self.databus = DataBus()
-        self.simulation_flow = SimulationFlow()
+        self.simulation_flow = SimulationFlow(max_history=self.sim_config.history_max_steps)
         self.result_manager = ResultManager(self.simulation_flow)
 
         self.process_nodes: List[ProcessNode] = []
         self.process_map: Dict[str, ProcessNode] = {}
 
         self.connection_manager = ConnectionManager()
+        # Ordre d'exécution et connexions amont figés, construits au premier pas
+        self._schedule: Optional[List[Tuple[ProcessNode, List[Tuple[str, Connection]]]]] = None
 
         self.is_running = False
 
@@ -47,6 +56,7 @@ class SimulationOrchestrator:
             raise ValueError(f"Duplicate ProcessNode ID '{process.node_id}'")
         self.process_nodes.append(process)
         self.process_map[process.node_id] = process
+        self._schedule = None
         self.logger.info(f"ProcessNode ajouté : {process.name}")
 
     def initialize(self) -> None:
@@ -55,9 +65,10 @@ class SimulationOrchestrator:
         """
         self.logger.info("Initialisation de la simulation ...")
         self._setup_connections()
+        self._schedule = None
         for process in self.process_nodes:
             process.initialize()
-        influent = InfluentInitializer.create_from_config(self.config, self.state.current_time)
+        influent = InfluentInitializer.create_from_config(self.influent_spec, self.state.current_time)
         self.databus.write_flow('influent', influent)
         self.simulation_flow.add_flow('influent', influent)
         self.logger.info("Simulation initialisée")
@@ -89,7 +100,12 @@ class SimulationOrchestrator:
             for warning in validation['warnings']:
                 self.logger.warning(warning)
 
-        self.logger.info("\n"+self.connection_manager.visualize_ascii())
+        # Échoue avant la simulation si un cycle n'est pas marqué comme recyclage ;
+        # l'ordre calculé est mémorisé et réutilisé par _build_schedule
+        self.connection_manager.get_execution_order()
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("\n"+self.connection_manager.visualize_ascii())
    
     def _create_sequential_connections(self) -> None:
         """Crée une chaîne séquentielle simple"""
@@ -99,9 +115,7 @@ class SimulationOrchestrator:
         first = self.process_nodes[0]
         self.connection_manager.add_connection('influent', first.node_id, 1.0, False)
 
-        for i in range(len(self.process_nodes) - 1):
-            current = self.process_nodes[i]
-            next_proc = self.process_nodes[i+1]
+        for current, next_proc in pairwise(self.process_nodes):
             self.connection_manager.add_connection(
                 current.node_id,
                 next_proc.node_id,
@@ -120,7 +134,7 @@ class SimulationOrchestrator:
         total_steps = self.state.total_steps
         self.logger.info(f"Simulation : {total_steps} pas de temps")
 
-        while self.state.current_time < self.state.end_time:
+        for _ in range(self.state.remaining_steps()):
             self._run_timestep()
             self.state.advance()
             if self.state.current_step % 100 == 0:
@@ -140,36 +154,67 @@ class SimulationOrchestrator:
         """
         Exécute un seul pas de temps de simulation
         """
-        execution_order = self.connection_manager.get_execution_order()
-
-        for node_id in execution_order:
-            if node_id == 'influent':
-                continue
+        schedule = self._schedule
+        if schedule is None:
+            schedule = self._schedule = self._build_schedule()
+        produced: Dict[str, FlowData] = {}
 
-            process = self.process_map.get(node_id)
-            if not process:
-                continue
+        # Méthodes liées une fois par pas plutôt qu'à chaque procédé
+        get_inputs = self._get_process_inputs
+        create_flow = self._create_output_flow
+        write_flow = self.databus.write_flow
+        dt = self.state.timestep
 
-            inputs = self._get_process_inputs(process)
+        for process, upstream_connections in schedule:
+            inputs = get_inputs(process, upstream_connections)
 
-            outputs = process.process(inputs, dt=self.state.timestep)
+            outputs = process.process(inputs, dt=dt)
             process.update_state(outputs)
 
-            flow = self._create_output_flow(process, outputs)
-            self.databus.write_flow(process.node_id, flow)
-            self.simulation_flow.add_flow(process.node_id, flow)
+            flow = create_flow(process, outputs)
+            # Écriture immédiate sur le bus : les noeuds aval lisent ce flux au même pas
+            node_id = process.node_id
+            write_flow(node_id, flow)
+            produced[node_id] = flow
+
+        self.simulation_flow.add_flows(produced)
 
-    def _get_process_inputs(self, process: ProcessNode) -> Dict[str, Any]:
+    def _build_schedule(self) -> List[Tuple[ProcessNode, List[Tuple[str, Connection]]]]:
+        """
+        Résout une fois la topologie (statique pendant la simulation)
+
+        Returns:
+            List[Tuple[ProcessNode, List[Tuple[str, Connection]]]]: procédés dans
+            l'ordre d'exécution avec leurs connexions amont
+        """
+        schedule = []
+        for node_id in self.connection_manager.get_execution_order():
+            if node_id == 'influent':
+                continue
+            process = self.process_map.get(node_id)
+            if process is None:
+                continue
+            schedule.append((process, self.connection_manager.get_upstream_nodes(node_id)))
+        return schedule
+
+    def _get_process_inputs(
+        self,
+        process: ProcessNode,
+        upstream_connections: Optional[List[Tuple[str, Connection]]] = None
+    ) -> Dict[str, Any]:
         """
         Récupère les inputs pour un ProcessNode depuis le DataBus
 
         Args:
             process (ProcessNode): ProcessNode dont on veut les inputs
+            upstream_connections (Optional[List[Tuple[str, Connection]]]): connexions
+                amont déjà résolues ; recalculées si None
 
         Returns:
             Dict[str, Any]: Dictionnaire des inputs
         """
-        upstream_connections = self.connection_manager.get_upstream_nodes(process.node_id)
+        if upstream_connections is None:
+            upstream_connections = self.connection_manager.get_upstream_nodes(process.node_id)
 
         if not upstream_connections:
             self.logger.warning(f"Aucun upstream pour {process.node_id}")
@@ -191,7 +236,7 @@ class SimulationOrchestrator:
                 'flow': source_flow,
                 'flowrate': source_flow.flowrate * fraction,
                 'temperature': source_flow.temperature,
-                'components': source_flow.components.copy()
+                'components': source_flow.components_readonly
             } 
         return self._mix_multiple_sources(upstream_connections)
     
@@ -204,9 +249,10 @@ class SimulationOrchestrator:
         weighted_components: Dict[str, float] = {}
 
         reference_flow = None
+        read_flow = self.databus.read_flow
 
         for source_id, connection in upstream_connections:
-            source_flow = self.databus.read_flow(source_id)
+            source_flow = read_flow(source_id)
 
             if not source_flow:
                 if connection.is_recycle:
@@ -223,28 +269,28 @@ class SimulationOrchestrator:
 
             weighted_temp += source_flow.temperature * fractional_flowrate
 
+            # Lecture seule des composants source : aucune copie par source
             for component, concentration in source_flow.components.items():
                 if not isinstance(concentration, (int, float)):
                     continue
-                if component not in weighted_components:
-                    weighted_components[component] = 0.0
-                weighted_components[component] += concentration * fractional_flowrate
+                weighted_components[component] = (
+                    weighted_components.get(component, 0.0) + concentration * fractional_flowrate
+                )
 
         if total_flowrate == 0:
             self.logger.error("Débit total nul après mélange")
             return {}
         
         mixed_temperature = weighted_temp / total_flowrate
-        mixed_components = {
-            comp: value / total_flowrate
-            for comp, value in weighted_components.items()
-        }
+        # Normalisation en place : le dict d'accumulation devient le mélange
+        for comp in weighted_components:
+            weighted_components[comp] /= total_flowrate
 
         return {
             'flow': reference_flow,
             'flowrate': total_flowrate,
             'temperature': mixed_temperature,
-            'components': mixed_components
+            'components': weighted_components
         }
 
     def _create_output_flow(self, process: ProcessNode, outputs: Dict[str, Any]):
@@ -258,26 +304,29 @@ class SimulationOrchestrator:
         Returns:
             FlowData: FlowData contruit
         """
-        from core.data.flow_data import FlowData
+        # Dict produit par process() pour ce pas : repris sans copie
+        components = outputs.get('components') or {}
+
+        # Séparer les métriques opérationnelles des composants chimiques :
+        # - flow.components  → variables d'état ASM (si, ss, xi, xs, xbh…)
+        # - flow.metrics     → métriques calculées (srt_days, svi, energy_kwh…)
+        metrics = {
+            key: value for key, value in outputs.items()
+            if key not in _STRUCTURAL_KEYS and key not in components
+        }
+
         flow = FlowData(
             timestamp=self.state.current_time,
             flowrate=outputs.get('flowrate', 0.0),
             temperature=outputs.get('temperature', 20.0),
+            components=components,
+            metrics=metrics,
             model_type=outputs.get('model_type'),
             source_node=process.node_id
         )
 
-        flow.components = outputs.get('components', {}).copy()
-
-        # Séparer les métriques opérationnelles des composants chimiques :
-        # - flow.components  → variables d'état ASM (si, ss, xi, xs, xbh…)
-        # - flow.metrics     → métriques calculées (srt_days, svi, energy_kwh…)
-        _structural_keys = {'components', 'underflow', 'flowrate', 'temperature', 'model_type'}
-        for key, value in outputs.items():
-            if key not in _structural_keys and key not in flow.components:
-                flow.metrics[key] = value
-
-        for key in ['cod', 'tss', 'bod', 'tkn', 'nh4', 'no3', 'po4']:
+        # Affectés après construction : pas de remise à zéro des négatifs (__post_init__)
+        for key in _OUTPUT_MEASURED_KEYS:
             if key in outputs:
                 setattr(flow, key, outputs[key])
         return flow
\ No newline at end of file
@@ -1,6 +1,7 @@
 import logging
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Type
 from importlib import import_module
 
@@ -9,6 +10,11 @@ from core.process.process_parameter import ProcessParameter
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _resolve_class(module: str, class_name: str) -> Type[ProcessNode]:
+    """Importe une classe de procédé, mémorisé pour toutes les définitions (et registres)"""
+    return getattr(import_module(module), class_name)
+
 @dataclass
 class ProcessDefinition:
     """Définition complète d'un type de procédé"""
@@ -26,6 +32,14 @@ class ProcessDefinition:
 
     _class_cache : Optional[Type[ProcessNode]] = field(default=None, repr=False)
 
+    # Vues précalculées : paramètres requis + optionnels, fusionnés une seule fois
+    _param_dict: Dict[str, ProcessParameter] = field(init=False, repr=False, compare=False)
+    _default_config: Dict[str, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._param_dict = {p.name: p for p in (*self.required_params, *self.optional_params)}
+        self._default_config = {name: p.default for name, p in self._param_dict.items()}
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ProcessDefinition':
         """Crée une ProcessDefinition depuis un dictionnaire"""
@@ -52,9 +66,8 @@ class ProcessDefinition:
         """
         if self._class_cache is None:
             try:
-                module = import_module(self.module)
-                self._class_cache = getattr(module, self.class_name)
-                logger.debug(f"Classe chargée : {self.module}.{self.class_name}")
+                self._class_cache = _resolve_class(self.module, self.class_name)
+                logger.debug("Classe chargée : %s.%s", self.module, self.class_name)
             except (ImportError, AttributeError) as e:
                 raise ImportError(
                     f"Impossible de charger {self.class_name} depuis {self.module} : {e}"
@@ -64,14 +77,8 @@ class ProcessDefinition:
     
     def get_all_params(self) -> Dict[str, ProcessParameter]:
         """Retourne tous les paramètres (requis + optionnels)"""
-        params = {}
-        for p in self.required_params + self.optional_params:
-            params[p.name] = p
-        return params
+        return self._param_dict.copy()
     
     def get_default_config(self) -> Dict[str, float]:
         """Retourne une configuration avec les valeurs par défaut"""
-        config = {}
-        for param in self.required_params + self.optional_params:
-            config[param.name] = param.default
-        return config
\ No newline at end of file
+        return self._default_config.copy()
\ No newline at end of file
@@ -6,8 +6,11 @@ Rôle :
 - Gérer les connexions entre procédés
 - Centraliser la logique de création
 """
+from concurrent.futures import ThreadPoolExecutor
+from itertools import pairwise
 from typing import Dict, Any, List
 import logging
+import os
 
 from core.process.process_node import ProcessNode
 from core.process.process_registry import ProcessRegistry
@@ -16,6 +19,11 @@ from core.connection.connection_manager import ConnectionManager
 
 logger = logging.getLogger(__name__)
 
+# En dessous de ce nombre de procédés, la création reste séquentielle
+# (le démarrage des threads coûterait plus que le gain)
+_PARALLEL_MIN_PROCESSES = 8
+_MAX_WORKERS = 8
+
 class ProcessFactory:
     """
     Factory pour créer et connecter les ProcessNodes
@@ -64,16 +72,19 @@ class ProcessFactory:
         if not processes_config:
             raise ValueError("Aucun procédé défini dans la configuration")
         
-        processes = []
-
-        for proc_config in processes_config:
-            process = ProcessFactory.create_process(proc_config)
-            processes.append(process)
+        if len(processes_config) >= _PARALLEL_MIN_PROCESSES:
+            # Le chargement des modèles (fichiers, imports) libère le GIL ;
+            # map conserve l'ordre de la configuration et propage les erreurs
+            workers = min(_MAX_WORKERS, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                processes = list(executor.map(ProcessFactory.create_process, processes_config))
+        else:
+            processes = [ProcessFactory.create_process(proc_config) for proc_config in processes_config]
 
         # Configure les connexions si spécifiées
         ProcessFactory._setup_connections(processes, config)
 
-        logger.info(f"{len(processes)} procédé(s) crée(s)")
+        logger.info("%d procédé(s) crée(s)", len(processes))
 
         return processes
     
@@ -88,14 +99,17 @@ class ProcessFactory:
             configs (List[Dict[str, Any]]): Configurations correspondantes
         """
         conn_manager = ConnectionManager()
-        # Crée un mapping node_id -> ProcessNode
-        process_map = {p.node_id: p for p in processes}
 
         if 'connections' not in config or not config['connections']:
             ProcessFactory._create_sequentiel_chain(processes, conn_manager)
-            logger.info("\n" + conn_manager.visualize_ascii())
+            # Le rendu ASCII parcourt tout le graphe : seulement si le message sera émis
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n" + conn_manager.visualize_ascii())
             return 
 
+        # Crée un mapping node_id -> ProcessNode (uniquement utile aux connexions explicites)
+        process_map = {p.node_id: p for p in processes}
+
         for conn_config in config.get('connections', []):
             source = conn_config['source']
             target = conn_config['target']
@@ -105,11 +119,13 @@ class ProcessFactory:
             # Ajouter au ConnectionManager
             conn_manager.add_connection(source, target, fraction, is_recycle)
 
-            # Configurer les ProcessNodes
-            if target in process_map:
-                process_map[target].connect_upstream(source)
-            if source in process_map:
-                process_map[source].connect_downstream(target)
+            # Configurer les ProcessNodes (une seule recherche par extrémité)
+            target_node = process_map.get(target)
+            if target_node is not None:
+                target_node.connect_upstream(source)
+            source_node = process_map.get(source)
+            if source_node is not None:
+                source_node.connect_downstream(target)
 
         # Valider
         validation = conn_manager.validate()
@@ -117,8 +133,12 @@ class ProcessFactory:
             for error in validation['errors']:
                 logger.error(error)
             raise Exception("Erreurs dans le graphe de connexions")
-        
-        logger.info("\n"+conn_manager.visualize_ascii())
+
+        # Tri topologique (Kahn, O(V+E)) : un cycle non marqué échoue dès la construction
+        conn_manager.get_execution_order()
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n"+conn_manager.visualize_ascii())
         return 
     
     @staticmethod
@@ -137,15 +157,12 @@ class ProcessFactory:
         conn_manager.add_connection('influent', first.node_id, 1.0, False)
         first.connect_upstream('influent')
 
-        for i in range(len(processes) - 1):
-            current = processes[i]
-            next_proc = processes[i+1]
-
+        for current, next_proc in pairwise(processes):
             conn_manager.add_connection(current.node_id, next_proc.node_id, 1.0, False)
             current.connect_downstream(next_proc.node_id)
             next_proc.connect_upstream(current.node_id)
 
-            logger.debug(f"Chaîne séquentiel : {current.node_id} -> {next_proc.node_id}")
+            logger.debug("Chaîne séquentiel : %s -> %s", current.node_id, next_proc.node_id)
     
     @staticmethod
     def get_available_types() -> List[str]:
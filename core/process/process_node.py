@@ -6,16 +6,33 @@ import logging
 import importlib
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple
 from utils.decorators import safe_fractionation
 
 from core.registries.fractionation.registry import FractionationRegistry
 
+_LOGGER = logging.getLogger(__name__)
+
+class _NodeLoggerAdapter(logging.LoggerAdapter):
+    """
+    Logger partagé par tous les noeuds, préfixe les messages par l'ID du noeud
+
+    node_id est aussi exposé en extra pour les handlers qui veulent l'utiliser.
+    """
+
+    def process(self, msg: Any, kwargs: Dict[str, Any]) -> Any:
+        kwargs['extra'] = {**self.extra, **kwargs.get('extra', {})}
+        return f"[{self.extra['node_id']}] {msg}", kwargs
+
 class ProcessNode(ABC):
     """
     Classe abstraite représentant un noeud de procédé dans la chaine de traitement
     """
 
+    # Clés requises mémorisées par classe (get_required_inputs est supposé constant)
+    _required_inputs_cache: Optional[frozenset] = None
+
     def __init__(self, node_id: str, name: str, config: Dict[str, Any], current_hash: Optional[str] = None):
         """
         Initialise un noeud de procédé
@@ -28,7 +45,8 @@ class ProcessNode(ABC):
         self.node_id = node_id
         self.name = name
         self.config = config
-        self.logger = logging.getLogger(f"{__name__}.{node_id}")
+        # Un seul logger de module : pas d'entrée par noeud dans le registre de logging
+        self.logger = _NodeLoggerAdapter(_LOGGER, {'node_id': node_id})
         self.current_hash = current_hash
 
         # Etat interne du procédé
@@ -36,16 +54,16 @@ class ProcessNode(ABC):
         self.inputs: Dict[str, Any] = {}
         self.outputs: Dict[str, Any] = {}
 
-        # Connexions avec d'autres noeuds
-        self.upstream_nodes: List[str] = []
-        self.downstream_nodes: List[str] = []
+        # Connexions avec d'autres noeuds (dict ordonné : test d'appartenance en O(1))
+        self._upstream: Dict[str, None] = {}
+        self._downstream: Dict[str, None] = {}
 
         # Performance
         self.metrics: Any = {}
 
         self.fractionation_registry = FractionationRegistry.get_instance()
 
-        self.logger.info(f"ProcessNode '{name}' ({node_id}) initialisé")
+        self.logger.info("ProcessNode '%s' (%s) initialisé", name, node_id)
 
     @abstractmethod
     def initialize(self) -> None:
@@ -64,7 +82,9 @@ class ProcessNode(ABC):
             dt: Pas de temps de simulation
         
         Returns :
-            Dictionnaire contenant les sorties du procédés
+            Dictionnaire contenant les sorties du procédés. outputs['components']
+            doit être un dict neuf : le FlowData de sortie en prend possession
+            sans copie
         """
         pass
 
@@ -88,14 +108,20 @@ class ProcessNode(ABC):
         Returns :
             True si valide, False sinon
         """
-        required_keys = self.get_required_inputs()
-        for key in required_keys:
-            if key not in inputs:
-                self.logger.error(f"Entrée manquante: {key}")
-                return False
-            if inputs[key] is None:
-                self.logger.error(f"Entrée nulle: {key}")
-                return False
+        cls = type(self)
+        # Lu dans le __dict__ de la classe : une sous-classe n'hérite pas du cache parent
+        required_keys = cls.__dict__.get('_required_inputs_cache')
+        if required_keys is None:
+            required_keys = cls._required_inputs_cache = frozenset(self.get_required_inputs())
+
+        missing = required_keys - inputs.keys()
+        if missing:
+            self.logger.error("Entrée(s) manquante(s): %s", sorted(missing))
+            return False
+        null = [key for key in required_keys if inputs[key] is None]
+        if null:
+            self.logger.error("Entrée(s) nulle(s): %s", sorted(null))
+            return False
         return True
 
     @abstractmethod
@@ -119,11 +145,10 @@ class ProcessNode(ABC):
             bool: True si fractionnement nécessaire
         """
         flow = inputs.get('flow')
-        if not flow:
-            return False
-        if flow.has_model_components():
+        # Cas courant en simulation : flux déjà fractionné, une seule lecture
+        if flow is None or flow.has_model_components():
             return False
-        
+
         return flow.cod > 0 or flow.tss > 0 or flow.tkn > 0
     
     @safe_fractionation
@@ -143,20 +168,20 @@ class ProcessNode(ABC):
             return inputs
         
         flow = inputs['flow']
-        self.logger.debug(f"Fractionnement en cours vers {target_model}...")
+        self.logger.debug("Fractionnement en cours vers %s...", target_model)
         
-        measured = flow.extract_measured()
+        get = flow.extract_measured().get
 
         try:
             fractionated = self.fractionation_registry.fractionate(
                 model_type=target_model,
-                cod=measured.get('cod', 0.0),
-                tss=measured.get('tss', 0.0),
-                tkn=measured.get('tkn', 0.0),
-                nh4=measured.get('nh4', 0.0),
-                no3=measured.get('no3', 0.0),
-                po4=measured.get('po4', 0.0),
-                alkalinity=measured.get('alkalinity')
+                cod=get('cod', 0.0),
+                tss=get('tss', 0.0),
+                tkn=get('tkn', 0.0),
+                nh4=get('nh4', 0.0),
+                no3=get('no3', 0.0),
+                po4=get('po4', 0.0),
+                alkalinity=get('alkalinity')
             )
             fractionated_flow = flow.copy()
             fractionated_flow.components.update(fractionated)
@@ -164,40 +189,59 @@ class ProcessNode(ABC):
             inputs['flow'] = fractionated_flow
             inputs['components'] = fractionated_flow.components
 
-            self.logger.debug(f"Fractionnement réussi : {len(fractionated)} composants")
+            self.logger.debug("Fractionnement réussi : %d composants", len(fractionated))
         except Exception as e:
             self.logger.error(f"Erreur lors du fractionnement : {e}")
             raise
 
         return inputs
 
-    def get_outputs(self) -> Dict[str, Any]:
+    def get_outputs(self) -> Mapping[str, Any]:
         """
         Retourne les sorties actuelles du procédé
 
         Returns :
-            Dictionnaire des valeurs de sortie
+            Vue en lecture seule des valeurs de sortie (sans copie) ;
+            dict(...) pour obtenir un dictionnaire modifiable
         """
-        return self.outputs.copy()
+        return MappingProxyType(self.outputs)
     
-    def get_state(self) -> Dict[str, Any]:
+    def get_state(self) -> Mapping[str, Any]:
         """
         Retourne l'état actuel du procédé
 
         Returns : 
-            Dictionnaire de l'état interne
+            Vue en lecture seule de l'état interne (sans copie)
         """
-        return self.state.copy()
+        return MappingProxyType(self.state)
     
-    def get_metrics(self) -> Dict[str, float]:
+    def get_metrics(self) -> Mapping[str, float]:
         """
         Retourne les métriques de performance du procédé
 
         Returns :
-            Dictionnaire des métriques calculées
+            Vue en lecture seule des métriques calculées (sans copie)
         """
-        return self.metrics.copy()
+        return MappingProxyType(self.metrics)
     
+    @property
+    def upstream_nodes(self) -> Tuple[str, ...]:
+        """IDs des noeuds en amont, dans l'ordre de connexion (lecture seule)"""
+        return tuple(self._upstream)
+
+    @upstream_nodes.setter
+    def upstream_nodes(self, node_ids: Iterable[str]) -> None:
+        self._upstream = dict.fromkeys(node_ids)
+
+    @property
+    def downstream_nodes(self) -> Tuple[str, ...]:
+        """IDs des noeuds en aval, dans l'ordre de connexion (lecture seule)"""
+        return tuple(self._downstream)
+
+    @downstream_nodes.setter
+    def downstream_nodes(self, node_ids: Iterable[str]) -> None:
+        self._downstream = dict.fromkeys(node_ids)
+
     def connect_upstream(self, node_id: str) -> None:
         """
         Connecte un noeud en amont
@@ -205,9 +249,9 @@ class ProcessNode(ABC):
         Args :
             node_id : ID du noeud à connecter en amont
         """
-        if node_id not in self.upstream_nodes:
-            self.upstream_nodes.append(node_id)
-            self.logger.debug(f"Noeud {node_id} connecté en amont")
+        if node_id not in self._upstream:
+            self._upstream[node_id] = None
+            self.logger.debug("Noeud %s connecté en amont", node_id)
 
     def connect_downstream(self, node_id: str) -> None:
         """
@@ -216,9 +260,9 @@ class ProcessNode(ABC):
         Args :
             node_id : ID du noeud à connecter en aval
         """
-        if node_id not in self.downstream_nodes:
-            self.downstream_nodes.append(node_id)
-            self.logger.debug(f"Noeud {node_id} connecté en aval")
+        if node_id not in self._downstream:
+            self._downstream[node_id] = None
+            self.logger.debug("Noeud %s connecté en aval", node_id)
     
     def reset(self) -> None:
         """
@@ -229,7 +273,7 @@ class ProcessNode(ABC):
         self.outputs.clear()
         self.metrics.clear()
         self.initialize()
-        self.logger.info(f"ProcessNode '{self.name}' réinitialisé")
+        self.logger.info("ProcessNode '%s' réinitialisé", self.name)
 
     def __repr__(self) -> str:
         return f"<ProcessNode(id={self.node_id}, name={self.name})>"
\ No newline at end of file
@@ -1,9 +1,9 @@
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, Union
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple, Union
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessParameter:
-    """Représente un paramètre de procédé"""
+    """Représente un paramètre de procédé (immuable, partagé par les définitions du catalogue)"""
     name: str
     label: str
     unit: str
@@ -11,7 +11,7 @@ class ProcessParameter:
     min: Optional[float] = 0
     max: Optional[float] = 0
     type: Optional[str] = ""
-    choices: Optional[List[str]] = field(default_factory=list)
+    choices: Optional[Tuple[str, ...]] = ()
     description: Optional[str] = None
 
 
@@ -25,7 +25,7 @@ class ProcessParameter:
             min=data.get('min'),
             max=data.get('max'),
             type=data.get('type'),
-            choices=data.get('choices', []),
+            choices=tuple(data.get('choices') or ()),
             description=data.get('description')
         )
     
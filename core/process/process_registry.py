@@ -3,14 +3,15 @@ Registre centralisé des procédés disponibles
 
 Ce module charge dynamiquement les procédés depuis un fichier json et gère leur instanciation
 """
-import json
 import logging
+import threading
 
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 from core.process.process_node import ProcessNode
 from core.process.process_definition import ProcessDefinition
+from utils.json_utils import load_json_cached, read_definition_cached
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ class ProcessRegistry:
     """
 
     _instance = None
+    _lock = threading.Lock()
 
     def __init__(self, catalog_path: Optional[Path]) -> None:
         if catalog_path is None:
@@ -28,6 +30,9 @@ class ProcessRegistry:
         self.catalog_path = catalog_path
         self.processes: Dict[str, ProcessDefinition] = {}
         self.categories: Dict[str, Dict[str, str]] = {}
+        # Formats CLI mémorisés, invalidés à chaque chargement du catalogue
+        self._cli_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._default_params_cache: Optional[Dict[str, Dict[str, float]]] = None
 
         self._load_catalog()
 
@@ -38,14 +43,14 @@ class ProcessRegistry:
                 f"Catalogue de procédés introuvable : {self.catalog_path}"
             )
         
-        index_path = self.catalog_path / 'index.json'
-        with open(index_path, 'r', encoding='utf-8') as f:
-            index = json.load(f)
-        
-        categories_path = self.catalog_path / 'index.json'
+        self._cli_cache = None
+        self._default_params_cache = None
+
+        index = load_json_cached(self.catalog_path / 'index.json')
+
+        categories_path = self.catalog_path / 'categories.json'
         if categories_path.exists():
-            with open(categories_path, 'r', encoding='utf-8') as f:
-                self.categories = json.load(f)
+            self.categories = dict(load_json_cached(categories_path))
 
         for entry in index.get('processes', []):
             process_path = self.catalog_path / entry['path']
@@ -54,34 +59,34 @@ class ProcessRegistry:
                 logger.warning(f"Fichier modèle introuvable : {process_path}")
                 continue
             
-            with open(process_path, 'r', encoding='utf-8') as f:
-                process_data = json.load(f)
-
-            definition = ProcessDefinition.from_dict(process_data)
+            definition = read_definition_cached(ProcessDefinition.from_dict, process_path, process_path.stat().st_mtime_ns)
             self.processes[definition.type] = definition
 
-            logger.debug(
-                f"Procédé chargé : {definition.type} ({process_path})"
-            )
+            logger.debug("Procédé chargé : %s (%s)", definition.type, process_path)
 
-        logger.debug(f"Catalogue chargé : {len(self.processes)} procédé(s)")
+        logger.debug("Catalogue chargé : %s procédé(s)", len(self.processes))
 
     @classmethod
     def get_instance(cls, catalog_path: Optional[Path] = None) -> 'ProcessRegistry':
-        """Retourne l'instance du registre"""
-        if cls._instance is None:
-            cls._instance = cls(catalog_path)
-        return cls._instance
+        """Retourne l'instance du registre (verrou uniquement à la création)"""
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls(catalog_path)
+            return cls._instance
     
     def get_process_definition(self, process_type: str) -> ProcessDefinition:
         """Récupère la définition d'un procédé"""
-        if process_type not in self.processes:
+        definition = self.processes.get(process_type)
+        if definition is None:
             available = ', '.join(self.processes.keys())
             raise ValueError(
                 f"Type de procédé inconnu : '{process_type}'. "
                 f"Type disponibles : {available}"
             )
-        return self.processes[process_type]
+        return definition
     
     def create_process(
             self,
@@ -109,7 +114,7 @@ class ProcessRegistry:
         full_config.update(config)
 
         instance = process_class(node_id, name, full_config)
-        logger.info(f"ProcessNode crée : {name} ({process_type})")
+        logger.info("ProcessNode crée : %s (%s)", name, process_type)
 
         return instance
     
@@ -141,9 +146,17 @@ class ProcessRegistry:
         """
         Convertit le registre au format attendu par CLIInterface
 
+        Le résultat est mémorisé et partagé : il ne doit pas être modifié.
+
         Returns:
             Dict[str, Dict[str, Any]]: Dict compatible avec CLIInterface.AVAILABLE_PROCESSES
         """
+        if self._cli_cache is None:
+            self._cli_cache = self._build_cli_format()
+        return self._cli_cache
+
+    def _build_cli_format(self) -> Dict[str, Dict[str, Any]]:
+        """Construit le format CLI à partir des définitions du catalogue"""
         cli_format = {}
 
         for i, (proc_type, definition) in enumerate(self.processes.items(), 1):
@@ -161,12 +174,15 @@ class ProcessRegistry:
         """
         Convertit le registre au format DEFAULT_PARAMS
 
+        Le résultat est mémorisé et partagé : il ne doit pas être modifié.
+
         Returns:
             Dict[str, Dict[str, float]]: Dict compatible avec CLIInterface.DEFAULT_PARAMS
         """
-        default_params = {}
-        for proc_type, definition in self.processes.items():
-            default_params[proc_type] = definition.get_default_config()
-
-        return default_params
+        if self._default_params_cache is None:
+            self._default_params_cache = {
+                proc_type: definition.get_default_config()
+                for proc_type, definition in self.processes.items()
+            }
+        return self._default_params_cache
     
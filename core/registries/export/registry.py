@@ -1,26 +1,56 @@
 """Registre centralisé des stratégies d'export"""
-import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional, Tuple
 
-from .strategies import (
-    ExportStrategy,
-    CSVExportStrategy,
-    JSONExportStrategy,
-    ExcelExportStrategy,
-    ParquetExportStrategy,
-)
+from utils.json_utils import loads as _json_loads
+from .strategies.base import ExportStrategy
 
 logger = logging.getLogger(__name__)
 
 _CONFIG_DIR = Path(__file__).parent / 'config'
 
-_ALL_STRATEGIES: Dict[str, ExportStrategy] = {
-    'csv': CSVExportStrategy(),
-    'json': JSONExportStrategy(),
-    'excel': ExcelExportStrategy(),
-    'parquet': ParquetExportStrategy(),
+
+def _build_csv() -> ExportStrategy:
+    from .strategies.csv import CSVExportStrategy
+    return CSVExportStrategy()
+
+
+def _build_json() -> ExportStrategy:
+    from .strategies.json_strategy import JSONExportStrategy
+    return JSONExportStrategy()
+
+
+def _build_excel() -> ExportStrategy:
+    from .strategies.excel import ExcelExportStrategy
+    return ExcelExportStrategy()
+
+
+def _build_parquet() -> ExportStrategy:
+    from .strategies.parquet import ParquetExportStrategy
+    return ParquetExportStrategy()
+
+
+_FALLBACK_FORMATS = ('csv', 'json')
+
+
+@lru_cache(maxsize=1)
+def _load_default_formats() -> Tuple[str, ...]:
+    """Lit default_formats.json une seule fois (partagé entre les registres)"""
+    config_path = _CONFIG_DIR / 'default_formats.json'
+    if not config_path.exists():
+        logger.warning(f"default_formats.json introuvable : {config_path}")
+        return _FALLBACK_FORMATS
+    config = _json_loads(config_path.read_bytes())
+    return tuple(config.get('defaults', _FALLBACK_FORMATS))
+
+
+_STRATEGY_CONSTRUCTORS: Dict[str, Callable[[], ExportStrategy]] = {
+    'csv': _build_csv,
+    'json': _build_json,
+    'excel': _build_excel,
+    'parquet': _build_parquet,
 }
 
 
@@ -30,7 +60,8 @@ class ExportRegistry:
     _instance = None
 
     def __init__(self):
-        self._strategies: Dict[str, ExportStrategy] = {}
+        # None : format par défaut déclaré, stratégie construite au premier get_strategy
+        self._strategies: Dict[str, Optional[ExportStrategy]] = {}
         self._default_export: set = set()
         self._register_defaults()
 
@@ -42,22 +73,13 @@ class ExportRegistry:
 
     def _register_defaults(self):
         """Charge les formats par défaut depuis default_formats.json"""
-        config_path = _CONFIG_DIR / 'default_formats.json'
-        default_formats = ['csv', 'json']  # fallback
-
-        if config_path.exists():
-            with open(config_path, encoding='utf-8') as f:
-                config = json.load(f)
-            default_formats = config.get('defaults', default_formats)
-        else:
-            logger.warning(f"default_formats.json introuvable : {config_path}")
-
-        for fmt in default_formats:
-            strategy = _ALL_STRATEGIES.get(fmt)
-            if strategy is None:
+        for fmt in _load_default_formats():
+            key = fmt.lower()
+            if key not in _STRATEGY_CONSTRUCTORS:
                 logger.warning(f"Format par défaut inconnu : '{fmt}'")
                 continue
-            self.register(strategy, default=True)
+            self._strategies[key] = None
+            self._default_export.add(key)
 
     def register(self, strategy: ExportStrategy, default: bool = False):
         """Enregistre une stratégie d'export"""
@@ -67,17 +89,21 @@ class ExportRegistry:
         self._strategies[key] = strategy
         if default:
             self._default_export.add(key)
-        logger.debug(f"Stratégie d'export enregistrée : {strategy.format_name}")
+        logger.debug("Stratégie d'export enregistrée : %s", strategy.format_name)
 
     def get_strategy(self, format_name: str) -> ExportStrategy:
         """Récupère la stratégie pour un format d'export"""
         key = format_name.lower()
-        if key not in self._strategies:
-            raise ValueError(
-                f"Export type '{key}' is not registered. "
-                f"Available exports: {list(self._strategies.keys())}"
-            )
-        return self._strategies[key]
+        strategy = self._strategies.get(key)
+        if strategy is None:
+            if key not in self._strategies:
+                raise ValueError(
+                    f"Export type '{key}' is not registered. "
+                    f"Available exports: {list(self._strategies.keys())}"
+                )
+            strategy = self._strategies[key] = _STRATEGY_CONSTRUCTORS[key]()
+            logger.debug("Stratégie d'export chargée : %s", key)
+        return strategy
 
     def get_available_formats(self) -> list[str]:
         return list(self._strategies.keys())
@@ -92,7 +118,7 @@ class ExportRegistry:
         if key not in self._strategies:
             raise ValueError(f"Export type '{key}' is not registered")
         del self._strategies[key]
-        logger.debug(f"Stratégie d'export supprimée : {key}")
+        logger.debug("Stratégie d'export supprimée : %s", key)
 
     def export(
         self,
@@ -106,7 +132,7 @@ class ExportRegistry:
         output_path.mkdir(parents=True, exist_ok=True)
         try:
             filepath = strategy.export(results, output_path, **kwargs)
-            logger.info(f"Export {format_name} réussi : {filepath}")
+            logger.info("Export %s réussi : %s", format_name, filepath)
             return filepath
         except Exception as e:
             logger.error(f"Erreur lors de l'export {format_name} : {e}")
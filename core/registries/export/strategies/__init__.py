@@ -1,5 +1,27 @@
+"""
+Stratégies d'export
+
+Les modules de stratégie sont importés au premier accès à leur classe, pour
+que `from .strategies.base import ...` ne charge pas tous les formats.
+"""
+import importlib
+
 from .base import ExportStrategy
-from .csv import CSVExportStrategy
-from .json_strategy import JSONExportStrategy
-from .excel import ExcelExportStrategy
-from .parquet import ParquetExportStrategy
+
+_LAZY_STRATEGIES = {
+    'CSVExportStrategy': '.csv',
+    'JSONExportStrategy': '.json_strategy',
+    'ExcelExportStrategy': '.excel',
+    'ParquetExportStrategy': '.parquet',
+}
+
+__all__ = ['ExportStrategy', *_LAZY_STRATEGIES]
+
+
+def __getattr__(name):
+    module_name = _LAZY_STRATEGIES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    strategy_cls = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = strategy_cls
+    return strategy_cls
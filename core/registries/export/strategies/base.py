@@ -1,23 +1,52 @@
 """Classe de base abstraite pour les stratégies d'export"""
+import inspect
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Sequence
+
+
+def flows_to_dataframe(flows: List[Dict[str, Any]], columns: Sequence[str]):
+    """
+    Tableau d'un historique sérialisé : colonnes demandées puis composants
+
+    Les composants sont convertis en un seul appel pandas et les colonnes
+    fixes insérées en tête, sans dictionnaire intermédiaire par ligne. Un
+    composant portant le nom d'une colonne fixe la remplace (comme
+    {**base, **components}).
+
+    Args:
+        flows (List[Dict[str, Any]]): Flux sérialisés (FlowData.to_dict)
+        columns (Sequence[str]): Clés reprises avant les composants
+
+    Returns:
+        pd.DataFrame: Une ligne par flux
+    """
+    import pandas as pd
+
+    df = pd.DataFrame([flow.get('components', {}) for flow in flows], index=range(len(flows)))
+    for position, col in enumerate(columns):
+        values = [flow.get(col) for flow in flows]
+        if col in df.columns:
+            df.insert(position, col, df.pop(col).combine_first(pd.Series(values, index=df.index)))
+        else:
+            df.insert(position, col, values)
+    return df
 
 
 class ExportStrategy(ABC):
     """Interface pour les stratégies d'export"""
 
-    @property
-    @abstractmethod
-    def format_name(self) -> str:
-        """Nom du format (ex: 'csv', 'json', 'excel')"""
-        pass
+    # Attributs de classe à définir par chaque stratégie
+    format_name: str        # Nom du format (ex: 'csv', 'json', 'excel')
+    file_extension: str     # Extension de fichier (ex: '.csv', '.json')
 
-    @property
-    @abstractmethod
-    def file_extension(self) -> str:
-        """Extension de fichier (ex: '.csv', '.json')"""
-        pass
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if inspect.isabstract(cls):
+            return  # classe intermédiaire : vérifié sur les stratégies concrètes
+        for attr in ('format_name', 'file_extension'):
+            if not isinstance(getattr(cls, attr, None), str):
+                raise TypeError(f"{cls.__name__} doit définir l'attribut de classe '{attr}'")
 
     @abstractmethod
     def export(self, results: Dict[str, Any], output_path: Path, **kwargs) -> Path:
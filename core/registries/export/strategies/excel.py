@@ -1,26 +1,27 @@
 """Stratégie d'export Excel"""
+import importlib.util
 from pathlib import Path
 from typing import Dict, Any
-from .base import ExportStrategy
+from .base import ExportStrategy, flows_to_dataframe
+
+# xlsxwriter (optionnel) est plus rapide qu'openpyxl, conservé sinon.
+# Pas de mode constant_memory : to_excel écrit colonne par colonne, ce mode
+# n'accepte que des écritures ligne par ligne.
+_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') is not None else 'openpyxl'
 
 
 class ExcelExportStrategy(ExportStrategy):
     """Export au format Excel avec plusieurs feuilles"""
 
-    @property
-    def format_name(self) -> str:
-        return "excel"
-
-    @property
-    def file_extension(self) -> str:
-        return ".xlsx"
+    format_name = "excel"
+    file_extension = ".xlsx"
 
     def export(self, results: Dict[str, Any], output_path: Path, **kwargs) -> Path:
         import pandas as pd
 
         filepath = output_path / f"{kwargs.get('name', 'simulation')}_results.xlsx"
 
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+        with pd.ExcelWriter(filepath, engine=_ENGINE) as writer:
             metadata = results.get('metadata', {})
             pd.DataFrame([metadata]).to_excel(writer, sheet_name='Metadata', index=False)
 
@@ -28,15 +29,7 @@ class ExcelExportStrategy(ExportStrategy):
             for node_id, flows in history.items():
                 if not flows:
                     continue
-                data = []
-                for flow in flows:
-                    row = {
-                        'timestamp': flow.get('timestamp'),
-                        'flowrate': flow.get('flowrate'),
-                        **flow.get('components', {})
-                    }
-                    data.append(row)
-                df = pd.DataFrame(data)
+                df = flows_to_dataframe(flows, ('timestamp', 'flowrate'))
                 df.to_excel(writer, sheet_name=node_id[:31], index=False)
 
         return filepath
@@ -1,25 +1,20 @@
 """Stratégie d'export JSON"""
-import json
 from pathlib import Path
 from typing import Dict, Any
+from utils.json_utils import dumps as _dumps
 from .base import ExportStrategy
 
 
 class JSONExportStrategy(ExportStrategy):
     """Export au format JSON"""
 
-    @property
-    def format_name(self) -> str:
-        return "json"
-
-    @property
-    def file_extension(self) -> str:
-        return ".json"
+    format_name = "json"
+    file_extension = ".json"
 
     def export(self, results: Dict[str, Any], output_path: Path, **kwargs) -> Path:
         filepath = output_path / f"{kwargs.get('name', 'simulation')}_full.json"
-        with open(filepath, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(results))
         return filepath
 
     def supports_node(self, node_type: str) -> bool:
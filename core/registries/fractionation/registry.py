@@ -1,8 +1,10 @@
 """Registre centralisé pour le fractionnement des modèles"""
 import json
 import logging
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 
 from .strategies import (
     FractionationStrategy,
@@ -56,16 +58,24 @@ class FractionationRegistry:
     """Registre centralisé des stratégies de fractionnement"""
 
     _instance = None
+    _lock = threading.Lock()
 
     def __init__(self):
         self._strategies: Dict[str, FractionationStrategy] = {}
+        # Stratégies par défaut déclarées mais pas encore construites :
+        # l'import du module de fractionnement est différé au premier get_strategy
+        self._pending: Dict[str, str] = {}
+        # Table de dispatch : type de modèle (tel que passé) → méthode fractionate liée
+        self._fractionate_fns: Dict[str, Callable[..., Dict[str, Any]]] = {}
         self._default_models: set = set()
         self._register_defaults()
 
     @classmethod
     def get_instance(cls) -> 'FractionationRegistry':
         if cls._instance is None:
-            cls._instance = cls()
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
     def _register_defaults(self):
@@ -79,43 +89,75 @@ class FractionationRegistry:
             model_strategies: Dict[str, str] = json.load(f)
 
         for model_key, strategy_name in model_strategies.items():
-            builder = _STRATEGY_CONSTRUCTORS.get(strategy_name)
-            if builder is None:
+            if strategy_name not in _STRATEGY_CONSTRUCTORS:
                 logger.warning(f"Constructeur inconnu pour '{strategy_name}' (modèle {model_key})")
                 continue
+            key = sys.intern(model_key.upper())
+            if key in self._pending:
+                continue  # alias déjà enregistré via un nom différent
+            self._pending[key] = strategy_name
+            self._default_models.add(key)
+
+    def _resolve_pending(self, key: str) -> Optional[FractionationStrategy]:
+        """
+        Construit la stratégie différée associée à key
+
+        Les alias partageant le même constructeur (ASM1 / ASM1MODEL) reçoivent
+        la même instance. Résolu sous _lock : des premiers get_strategy
+        concurrents obtiennent la même instance.
+        """
+        with self._lock:
+            # Un autre thread a pu construire la stratégie entre-temps
+            strategy_name = self._pending.get(key)
+            if strategy_name is None:
+                return self._strategies.get(key)
+
+            builder: Callable[[], Optional[FractionationStrategy]] = _STRATEGY_CONSTRUCTORS[strategy_name]
             strategy = builder()
             if strategy is None:
-                continue
-            try:
-                self.register(model_key, strategy, default=True)
-            except ValueError:
-                pass  # alias déjà enregistré via un nom différent
+                del self._pending[key]
+                self._default_models.discard(key)
+                return None
+
+            # Publiée dans _strategies avant de quitter _pending : une lecture
+            # sans verrou trouve toujours la clé dans l'un des deux
+            aliases = [k for k, name in self._pending.items() if name == strategy_name]
+            for alias in aliases:
+                self._strategies[alias] = strategy
+            for alias in aliases:
+                del self._pending[alias]
+        logger.debug("Stratégie de fractionnement chargée pour %s", key)
+        return strategy
 
     def register(self, model_type: str, strategy: FractionationStrategy, default: bool = False):
         """Enregistre une stratégie pour un type de modèle"""
-        key = model_type.upper()
-        if key in self._strategies:
+        key = sys.intern(model_type.upper())
+        if key in self._strategies or key in self._pending:
             raise ValueError(f"Model type '{key}' is already registered")
         self._strategies[key] = strategy
         if default:
             self._default_models.add(key)
-        logger.debug(f"Stratégie de fractionnement enregistrée pour {model_type}")
+        logger.debug("Stratégie de fractionnement enregistrée pour %s", model_type)
 
     def get_strategy(self, model_type: str) -> FractionationStrategy:
         """Récupère la stratégie pour un type de modèle"""
         key = model_type.upper()
-        if key not in self._strategies:
+        strategy = self._strategies.get(key)
+        if strategy is None and key in self._pending:
+            strategy = self._resolve_pending(key)
+        if strategy is None:
             raise ValueError(
                 f"Model type '{key}' is not registered. "
-                f"Available models: {list(self._strategies.keys())}"
+                f"Available models: {self.list_registered_models()}"
             )
-        return self._strategies[key]
+        return strategy
 
     def list_registered_models(self) -> list[str]:
-        return sorted(self._strategies.keys())
+        return sorted({*self._strategies, *self._pending})
 
     def is_registered(self, model_type: str) -> bool:
-        return model_type.upper() in self._strategies
+        key = model_type.upper()
+        return key in self._strategies or key in self._pending
 
     def unregister(self, model_type: str) -> None:
         key = model_type.upper()
@@ -124,7 +166,8 @@ class FractionationRegistry:
         if key not in self._strategies:
             raise ValueError(f"Model type '{key}' is not registered")
         del self._strategies[key]
-        logger.debug(f"Stratégie de fractionnement supprimée pour {key}")
+        self._fractionate_fns.clear()
+        logger.debug("Stratégie de fractionnement supprimée pour %s", key)
 
     def fractionate(
         self,
@@ -139,8 +182,11 @@ class FractionationRegistry:
         **kwargs
     ) -> Dict[str, Any]:
         """Fractionne les paramètres selon le modèle"""
-        strategy = self.get_strategy(model_type)
-        return strategy.fractionate(
+        fractionate_fn = self._fractionate_fns.get(model_type)
+        if fractionate_fn is None:
+            fractionate_fn = self.get_strategy(model_type).fractionate
+            self._fractionate_fns[model_type] = fractionate_fn
+        return fractionate_fn(
             cod=cod, tss=tss, tkn=tkn, nh4=nh4,
             no3=no3, po4=po4, alkalinity=alkalinity,
             **kwargs
@@ -12,6 +12,6 @@ class FractionationStrategy(ABC):
         pass
 
     @abstractmethod
-    def get_required_inputs(self) -> list[str]:
-        """Retourne la liste des inputs requis pour le fractionnement"""
+    def get_required_inputs(self) -> tuple[str, ...]:
+        """Retourne les inputs requis pour le fractionnement (tuple immuable partagé)"""
         pass
@@ -9,5 +9,5 @@ class NoFractionationStrategy(FractionationStrategy):
     def fractionate(self, **kwargs) -> Dict[str, float]:
         return kwargs.get('components', {})
 
-    def get_required_inputs(self) -> list[str]:
-        return []
+    def get_required_inputs(self) -> tuple[str, ...]:
+        return ()
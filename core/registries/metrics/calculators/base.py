@@ -2,6 +2,8 @@
 from typing import Dict, Any
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class MetricCalculator(ABC):
     """Interface pour les calculateurs de métriques"""
@@ -15,3 +17,57 @@ class MetricCalculator(ABC):
     ) -> Dict[str, float]:
         """Calcule les métriques"""
         pass
+
+    def calculate_batch(
+        self,
+        components: Dict[str, np.ndarray],
+        inputs: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calcule les métriques sur une série de pas de temps (colonnes numpy)
+
+        Les valeurs scalaires sont diffusées sur tous les pas de temps.
+        Implémentation par défaut : applique calculate() pas à pas ; les
+        sous-classes peuvent la remplacer par une version vectorisée.
+        """
+        n = _batch_length(components, inputs, context)
+        rows = [
+            self.calculate(
+                _row(components, i),
+                _row(inputs, i),
+                _row(context, i)
+            )
+            for i in range(n)
+        ]
+        if not rows:
+            return {}
+        return {key: np.array([row[key] for row in rows]) for key in rows[0]}
+
+
+def _batch_length(*columns: Dict[str, Any]) -> int:
+    """Longueur commune des colonnes numpy d'un lot"""
+    for data in columns:
+        for value in data.values():
+            if isinstance(value, np.ndarray):
+                return len(value)
+    return 0
+
+
+def _row(data: Dict[str, Any], i: int) -> Dict[str, Any]:
+    """Extrait la ligne i d'un dictionnaire de colonnes"""
+    return {k: (v[i] if isinstance(v, np.ndarray) else v) for k, v in data.items()}
+
+
+def _column(value: Any, n: int) -> np.ndarray:
+    """Convertit une valeur (scalaire ou colonne) en colonne float de longueur n"""
+    return np.broadcast_to(np.asarray(value, dtype=float), (n,))
+
+
+def _mlss_column(components: Dict[str, Any], inputs: Dict[str, Any], n: int) -> np.ndarray:
+    """MLSS par pas de temps : tss des composants, sinon tss des inputs"""
+    mlss_inputs = _column(inputs.get('tss', 0), n)
+    if components.get('tss') is None:
+        return mlss_inputs
+    mlss_components = _column(components['tss'], n)
+    return np.where(mlss_components != 0, mlss_components, mlss_inputs)
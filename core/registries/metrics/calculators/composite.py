@@ -1,13 +1,18 @@
 """Calculateur composite : somme de plusieurs composants"""
+import sys
 from typing import Dict, Any
-from .base import MetricCalculator
+
+import numpy as np
+
+from .base import MetricCalculator, _batch_length
 
 
 class CompositeMetricCalculator(MetricCalculator):
     """Calculateur qui combine plusieurs composants"""
 
     def __init__(self, component_names: list[str]):
-        self.component_names = component_names
+        # Noms internés : les recherches dans components comparent par identité
+        self.component_names = tuple(sys.intern(name) for name in component_names)
 
     def calculate(
         self,
@@ -18,3 +23,14 @@ class CompositeMetricCalculator(MetricCalculator):
         return {
             'value': sum(components.get(name, 0.0) for name in self.component_names)
         }
+
+    def calculate_batch(
+        self,
+        components: Dict[str, np.ndarray],
+        inputs: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        columns = [components[name] for name in self.component_names if name in components]
+        if not columns:
+            return {'value': np.zeros(_batch_length(components, inputs, context))}
+        return {'value': np.add.reduce(columns, axis=0, dtype=float)}
@@ -1,6 +1,9 @@
 """Calculateur de consommation énergétique"""
 from typing import Dict, Any
-from .base import MetricCalculator
+
+import numpy as np
+
+from .base import MetricCalculator, _batch_length, _column
 
 
 class EnergyConsumptionCalculator(MetricCalculator):
@@ -29,3 +32,38 @@ class EnergyConsumptionCalculator(MetricCalculator):
             'aeration_energy_kwh': aeration_energy_kwh,
             'energy_per_m3': energy_per_m3
         }
+
+    def calculate_batch(
+        self,
+        components: Dict[str, np.ndarray],
+        inputs: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        n = _batch_length(components, inputs, context)
+        cod_in = _column(inputs.get('cod_soluble_in', inputs.get('cod_in', 0)), n)
+        cod_out = _column(inputs.get('cod_soluble_out', inputs.get('cod_out', 0)), n)
+        flowrate = _column(inputs.get('flowrate', 0), n)
+        dt = _column(context.get('dt', 0), n)
+
+        # Opérations en place sur des tampons alloués une seule fois :
+        # pas de tableau temporaire par étape intermédiaire
+        total_volume_m3 = np.multiply(flowrate, dt)
+
+        oxygen_consumed_kg = np.subtract(cod_in, cod_out)
+        np.maximum(oxygen_consumed_kg, 0, out=oxygen_consumed_kg)
+        oxygen_consumed_kg *= total_volume_m3
+        oxygen_consumed_kg /= 1000.0
+
+        aeration_energy_kwh = np.multiply(oxygen_consumed_kg, 2.0)
+        np.maximum(aeration_energy_kwh, 0, out=aeration_energy_kwh)
+
+        energy_per_m3 = np.divide(
+            aeration_energy_kwh, total_volume_m3,
+            out=np.zeros(n), where=total_volume_m3 > 0
+        )
+
+        return {
+            'oxygen_consumed_kg': oxygen_consumed_kg,
+            'aeration_energy_kwh': aeration_energy_kwh,
+            'energy_per_m3': energy_per_m3
+        }
@@ -1,7 +1,9 @@
 """Calculateur du temps de rétention hydraulique (HRT)"""
 from typing import Dict, Any
+
 import numpy as np
-from .base import MetricCalculator
+
+from .base import MetricCalculator, _batch_length, _column
 
 
 class HRTCalculator(MetricCalculator):
@@ -21,6 +23,20 @@ class HRTCalculator(MetricCalculator):
         flowrate = inputs.get('flowrate', 0)
 
         hrt_hours = volume / flowrate if flowrate > 0 else 0
-        hrt_hours = np.clip(hrt_hours, self.min_hours, self.max_hours)
+        hrt_hours = min(max(hrt_hours, self.min_hours), self.max_hours)
 
         return {'hrt_hours': float(hrt_hours)}
+
+    def calculate_batch(
+        self,
+        components: Dict[str, np.ndarray],
+        inputs: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        n = _batch_length(components, inputs, context)
+        volume = _column(context.get('volume', 0), n)
+        flowrate = _column(inputs.get('flowrate', 0), n)
+
+        hrt_hours = np.divide(volume, flowrate, out=np.zeros(n), where=flowrate > 0)
+
+        return {'hrt_hours': np.clip(hrt_hours, self.min_hours, self.max_hours)}
@@ -2,6 +2,9 @@
 from typing import Dict, Any
 from .base import MetricCalculator
 
+# Résultat du cas « entrée absente », copié plutôt que reconstruit
+_ZERO_EFFICIENCY: Dict[str, float] = {'efficiency': 0.0}
+
 
 class RemovalEfficiencyCalculator(MetricCalculator):
     """Calcule l'efficacité d'élimination"""
@@ -22,4 +25,4 @@ class RemovalEfficiencyCalculator(MetricCalculator):
         if value_in > 0:
             efficiency = max(0, (value_in - value_out) / value_in * 100)
             return {'efficiency': min(98.0, efficiency)}
-        return {'efficiency': 0.0}
+        return _ZERO_EFFICIENCY.copy()
@@ -1,7 +1,9 @@
 """Calculateur du temps de rétention des solides (SRT)"""
 from typing import Dict, Any
+
 import numpy as np
-from .base import MetricCalculator
+
+from .base import MetricCalculator, _batch_length, _column, _mlss_column
 
 
 class SRTCalculator(MetricCalculator):
@@ -29,8 +31,33 @@ class SRTCalculator(MetricCalculator):
             wasted_solids_kg_per_day = waste_flow * mlss * 24 / 1000.0
 
             srt_days = total_solids_kg / wasted_solids_kg_per_day
-            srt_days = np.clip(srt_days, self.min_days, self.max_days)
+            srt_days = min(max(srt_days, self.min_days), self.max_days)
         else:
             srt_days = self.fallback_days
 
         return {'srt_days': float(srt_days)}
+
+    def calculate_batch(
+        self,
+        components: Dict[str, np.ndarray],
+        inputs: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        n = _batch_length(components, inputs, context)
+        mlss = _mlss_column(components, inputs, n)
+        volume = _column(context.get('volume', 0), n)
+        flowrate = _column(inputs.get('flowrate', 0), n)
+        waste_ratio = _column(context.get('waste_ratio', 0.01), n)
+
+        valid = (flowrate > 0) & (mlss > 100)
+        total_solids_kg = mlss * volume / 1000.0
+        wasted_solids_kg_per_day = flowrate * waste_ratio * mlss * 24 / 1000.0
+
+        srt_days = np.divide(
+            total_solids_kg, wasted_solids_kg_per_day,
+            out=np.full(n, np.inf), where=valid & (wasted_solids_kg_per_day > 0)
+        )
+        srt_days = np.clip(srt_days, self.min_days, self.max_days)
+
+        return {'srt_days': np.where(valid, srt_days, self.fallback_days)}
+
@@ -1,7 +1,9 @@
 """Calculateur de l'indice de volume des boues (SVI)"""
 from typing import Dict, Any
+
 import numpy as np
-from .base import MetricCalculator
+
+from .base import MetricCalculator, _batch_length, _mlss_column
 
 
 class SVICalculator(MetricCalculator):
@@ -30,8 +32,24 @@ class SVICalculator(MetricCalculator):
         if mlss > 100:
             mlss_g_L = mlss / 1000.0
             svi = self.formula_numerator / mlss_g_L
-            svi = np.clip(svi, self.min, self.max)
+            svi = min(max(svi, self.min), self.max)
         else:
             svi = self.fallback
 
         return {'svi': float(svi)}
+
+    def calculate_batch(
+        self,
+        components: Dict[str, np.ndarray],
+        inputs: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        n = _batch_length(components, inputs, context)
+        mlss = _mlss_column(components, inputs, n)
+
+        valid = mlss > 100
+        mlss_g_L = mlss / 1000.0
+        svi = np.divide(self.formula_numerator, mlss_g_L, out=np.zeros(n), where=valid)
+        svi = np.clip(svi, self.min, self.max)
+
+        return {'svi': np.where(valid, svi, self.fallback)}
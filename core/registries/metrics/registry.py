@@ -1,8 +1,12 @@
 """Registre centralisé pour le calcul des métriques de performance"""
 import json
 import logging
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional, Tuple
+
+import numpy as np
 
 from .calculators import (
     MetricCalculator, CompositeMetricCalculator,
@@ -11,6 +15,8 @@ from .calculators import (
 
 logger = logging.getLogger(__name__)
 
+MetricFunction = Callable[[Dict[str, float], Dict[str, Any], Dict[str, Any]], Dict[str, float]]
+
 _CONFIG_DIR = Path(__file__).parent / 'config'
 
 
@@ -18,17 +24,24 @@ class MetricsRegistry:
     """Registre centralisé des métriques de performance"""
 
     _instance = None
+    _lock = threading.Lock()
 
     def __init__(self):
         self._calculators: Dict[str, MetricCalculator] = {}
+        # Méthodes calculate liées, appelées directement dans les boucles
+        self._functions: Dict[str, MetricFunction] = {}
         self._model_metrics: Dict[str, list[str]] = {}
+        # Plan de calcul (nom, calculateur) par modèle, invalidé à chaque modification
+        self._model_plans: Dict[str, Tuple[Tuple[str, MetricFunction], ...]] = {}
         self._default_metrics: set = set()
         self._register_defaults()
 
     @classmethod
     def get_instance(cls) -> 'MetricsRegistry':
         if cls._instance is None:
-            cls._instance = cls()
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
     def _register_defaults(self):
@@ -53,23 +66,26 @@ class MetricsRegistry:
             with open(metrics_path, encoding='utf-8') as f:
                 model_metrics: Dict[str, list] = json.load(f)
             for model_type, metrics in model_metrics.items():
-                self._model_metrics[model_type] = metrics
+                self.register_model_metrics(model_type, metrics)
         else:
             logger.warning(f"model_metrics.json introuvable : {metrics_path}")
 
     def register(self, metric_name: str, calculator: MetricCalculator, default: bool = False):
         """Enregistre un calculateur de métrique"""
-        metric_name = metric_name.lower()
+        metric_name = sys.intern(metric_name.lower())
         if metric_name in self._calculators:
             raise ValueError(f"Calculator type {metric_name} is already registered")
         self._calculators[metric_name] = calculator
+        self._functions[metric_name] = calculator.calculate
+        self._model_plans.clear()
         if default:
             self._default_metrics.add(metric_name)
-        logger.debug(f"Calculateur de métrique enregistré : {metric_name}")
+        logger.debug("Calculateur de métrique enregistré : %s", metric_name)
 
     def register_model_metrics(self, model_type: str, metric_names: list[str]):
         """Associe des métriques à un type de modèle"""
-        self._model_metrics[model_type] = metric_names
+        self._model_metrics[model_type] = [sys.intern(name) for name in metric_names]
+        self._model_plans.pop(model_type, None)
 
     def get_model_metrics(self, model_type: str) -> list[str]:
         """Retourne les métriques applicables à un modèle"""
@@ -96,7 +112,9 @@ class MetricsRegistry:
         if metric_name not in self._calculators:
             raise ValueError(f"Calculator type '{metric_name}' is not registered")
         del self._calculators[metric_name]
-        logger.debug(f"Calculateur de métrique supprimé : {metric_name}")
+        del self._functions[metric_name]
+        self._model_plans.clear()
+        logger.debug("Calculateur de métrique supprimé : %s", metric_name)
 
     def calculate(
         self,
@@ -106,9 +124,10 @@ class MetricsRegistry:
         context: Dict[str, Any]
     ) -> Dict[str, float]:
         """Calcule une métrique spécifique"""
-        calculator = self.get_calculator(metric_name)
+        # get_calculator ne sert qu'à lever l'erreur explicite si absente
+        function = self._functions.get(metric_name) or self.get_calculator(metric_name).calculate
         try:
-            return calculator.calculate(components, inputs, context)
+            return function(components, inputs, context)
         except ValueError as e:
             raise ValueError(f"Erreur lors du calcul de {metric_name} : {e}")
 
@@ -120,9 +139,52 @@ class MetricsRegistry:
         context: Dict[str, Any]
     ) -> Dict[str, float]:
         """Calcule toutes les métriques pour un modèle"""
+        plan = self._model_plans.get(model_type)
+        if plan is None:
+            plan = self._build_model_plan(model_type)
+
+        results = {}
+        for metric_name, function in plan:
+            try:
+                results.update(function(components, inputs, context))
+            except ValueError as e:
+                raise ValueError(f"Erreur lors du calcul de {metric_name} : {e}")
+        return results
+
+    def _build_model_plan(self, model_type: str) -> Tuple[Tuple[str, MetricFunction], ...]:
+        """Résout une fois les calculateurs d'un modèle et mémorise le résultat"""
+        plan = tuple(
+            (metric_name, self.get_calculator(metric_name).calculate)
+            for metric_name in self.get_model_metrics(model_type)
+        )
+        self._model_plans[model_type] = plan
+        return plan
+
+    def calculate_batch(
+        self,
+        metric_name: str,
+        components: Dict[str, np.ndarray],
+        inputs: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        """Calcule une métrique sur une série de pas de temps (colonnes numpy)"""
+        calculator = self.get_calculator(metric_name)
+        try:
+            return calculator.calculate_batch(components, inputs, context)
+        except ValueError as e:
+            raise ValueError(f"Erreur lors du calcul de {metric_name} : {e}")
+
+    def calculate_all_for_model_batch(
+        self,
+        model_type: str,
+        components: Dict[str, np.ndarray],
+        inputs: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        """Calcule toutes les métriques d'un modèle sur une série de pas de temps"""
         results = {}
         for metric_name in self.get_model_metrics(model_type):
-            results.update(self.calculate(metric_name, components, inputs, context))
+            results.update(self.calculate_batch(metric_name, components, inputs, context))
         return results
 
 
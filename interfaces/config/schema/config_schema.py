@@ -18,7 +18,7 @@ class ConfigSchema:
     }
 
     OPTIONAL_FIELDS: Dict[str, List[str]] = {
-        'simulation': [],
+        'simulation': ['history_max_steps'],
         'influent': ['auto_fractionate', 'composition'],
         'processes': ['config', 'connections']
     }
@@ -4,8 +4,9 @@ Basé sur les méthodologies standards :
 - Henze et al. (2000) - Activated Sludge Models
 - Roeleveld & Van Loosdrecht (2002)
 """
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,13 @@ class ASM1Fraction:
     Fractionnement des paramètres mesurables en composants ASM1
     """
 
+    # Schéma fixe des 13 composants ASM1, dans l'ordre du catalogue (asm1.json)
+    COMPONENTS: Tuple[str, ...] = (
+        'si', 'ss', 'xi', 'xs', 'xbh', 'xba', 'xp',
+        'so', 'sno', 'snh', 'snd', 'xnd', 'salk'
+    )
+    INDEX: Dict[str, int] = {name: i for i, name in enumerate(COMPONENTS)}
+
     # Ratios par défaut (typiques pour eaux usées domestiques)
     DEFAULT_RATIOS = {
         # Fraction de la DCO
@@ -118,4 +126,43 @@ class ASM1Fraction:
             f"Rebuilt COD={cod_rebuilt:.1f} mg/L"
         )
 
-        return components
\ No newline at end of file
+        return components
+
+    @classmethod
+    def fractionate_array(
+        cls,
+        cod: float,
+        cod_soluble: Optional[float] = None,
+        tss: float = 0.0,
+        tkn: float = 0.0,
+        nh4: float = 0.0,
+        no3: float = 0.0,
+        po4: float = 0.0,
+        alkalinity: Optional[float] = None,
+        ratios: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """
+        Fractionne les paramètres mesurés en un vecteur de composants ASM1
+
+        Mêmes arguments que fractionate(). Le vecteur suit l'ordre de COMPONENTS
+        (indexable via INDEX) et peut être passé directement au modèle ASM1.
+
+        Returns :
+            Vecteur numpy (13,) des composants ASM1 (mg/L)
+        """
+        components = cls.fractionate(
+            cod=cod,
+            cod_soluble=cod_soluble,
+            tss=tss,
+            tkn=tkn,
+            nh4=nh4,
+            no3=no3,
+            po4=po4,
+            alkalinity=alkalinity,
+            ratios=ratios
+        )
+        return np.fromiter(
+            (components[name] for name in cls.COMPONENTS),
+            dtype=float,
+            count=len(cls.COMPONENTS)
+        )
\ No newline at end of file
@@ -38,8 +38,8 @@ class ASM1Model(ReactionModel):
         self.DEFAULT_PARAMS = model_definition.get_default_params()
 
         self.COMPONENT_INDICES = {
-            str(model_definition.get_components_names()[i]): i
-            for i in range(len(model_definition.get_components_names()))
+            str(name): i
+            for i, name in enumerate(model_definition.get_components_names())
         }
 
         # Utilise les paramètres par défaut et override avec ceux fournis
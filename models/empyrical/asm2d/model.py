@@ -31,8 +31,8 @@ class ASM2dModel(ReactionModel):
         self.DEFAULT_PARAMS = model_definition.get_default_params()
 
         self.COMPONENT_INDICES = {
-            model_definition.get_components_names()[i]: i
-            for i in range(len(model_definition.get_components_names()))
+            name: i
+            for i, name in enumerate(model_definition.get_components_names())
         }
 
         self.params = self.DEFAULT_PARAMS.copy()
@@ -235,6 +235,23 @@ class TestExecutionOrder:
         with pytest.raises(ValueError, match='Cycle'):
             manager.get_execution_order()
 
+    def test_execution_order_memoized_until_new_connection(self):
+        """Test : ordre mémorisé, recalculé après ajout de connexion"""
+        manager = ConnectionManager()
+        manager.add_connection('influent', 'p1', 1.0, False)
+
+        with patch.object(
+            manager, '_compute_execution_order', wraps=manager._compute_execution_order
+        ) as compute:
+            first = manager.get_execution_order()
+            first.append('mutated')
+            assert manager.get_execution_order() == ['influent', 'p1']
+            assert compute.call_count == 1
+
+            manager.add_connection('p1', 'p2', 1.0, False)
+            assert manager.get_execution_order() == ['influent', 'p1', 'p2']
+            assert compute.call_count == 2
+
 class TestCycleDetection:
     """Tests de détection de cycles"""
 
@@ -108,6 +108,24 @@ class TestFlowData:
         assert 'xbh' in all_comp
         assert 'so' in all_comp
 
+    def test_extract_measured(self):
+        """Test : extraction des paramètres mesurés"""
+        flow = FlowData(
+            timestamp=datetime.now(),
+            flowrate=1000.0,
+            temperature=20.0,
+            cod=500.0,
+            alkalinity=6.0
+        )
+        flow.components['xbh'] = 2500.0
+
+        measured = flow.extract_measured()
+
+        assert measured['cod'] == 500.0
+        assert measured['alkalinity'] == 6.0
+        assert 'xbh' not in measured
+        assert flow.extract_measured(['cod', 'xbh']) == {'cod': 500.0, 'xbh': 2500.0}
+
     def test_to_dict(self):
         """Test : conversion en dictionnaire"""
         flow = FlowData(
@@ -141,6 +159,57 @@ class TestFlowData:
         copy.flowrate = 2000.0
         assert original.flowrate == 1000.0
 
+    def test_copy_independent_dicts(self):
+        """Test : la copie ne partage pas components/metrics"""
+        original = FlowData(
+            timestamp=datetime.now(),
+            flowrate=1000.0,
+            temperature=20.0
+        )
+        original.components['xbh'] = 2500.0
+        original.metrics['svi'] = 120.0
+
+        copy = original.copy()
+        copy.components['xbh'] = 0.0
+        copy.metrics['svi'] = 0.0
+
+        assert original.components['xbh'] == 2500.0
+        assert original.metrics['svi'] == 120.0
+
+    def test_to_dict_flattens_metrics(self):
+        """Test : metrics aplaties à la racine de to_dict()"""
+        flow = FlowData(
+            timestamp=datetime.now(),
+            flowrate=1000.0,
+            temperature=20.0
+        )
+        flow.metrics['srt_days'] = 12.0
+
+        result = flow.to_dict()
+
+        assert result['srt_days'] == 12.0
+        assert 'metrics' not in result
+
+    def test_components_readonly_view(self):
+        """Test : vue en lecture seule sans copie, copie explicite modifiable"""
+        flow = FlowData(
+            timestamp=datetime.now(),
+            flowrate=1000.0,
+            temperature=20.0
+        )
+        flow.components['ss'] = 50.0
+
+        view = flow.components_readonly
+        with pytest.raises(TypeError):
+            view['ss'] = 0.0
+
+        flow.components['xi'] = 10.0
+        assert view['xi'] == 10.0
+
+        mutable = flow.mutable_components()
+        mutable['ss'] = 0.0
+        assert flow.components['ss'] == 50.0
+
     def test_validation_negative_flowrate(self):
         """Test : flowrate négatif rejeté"""
         with pytest.raises(ValueError):
@@ -171,6 +240,14 @@ class TestFlowData:
 
         assert flow.cod == 0.0
 
+    def test_slots_reject_unknown_attributes(self):
+        """Test : pas de __dict__ par instance, attributs inconnus refusés"""
+        flow = FlowData(timestamp=datetime.now(), flowrate=1000.0, temperature=20.0)
+
+        assert not hasattr(flow, '__dict__')
+        with pytest.raises(AttributeError):
+            flow.mlss = 3000.0
+
 class TestDataBus:
     """Tests pour DataBus"""
     
@@ -213,7 +290,22 @@ class TestDataBus:
 
         assert retrieved is not None
         assert retrieved.flowrate == 1000.0
-        assert retrieved.source_node == 'node_1'
+
+    def test_write_flow_does_not_mutate(self):
+        """Test : write_flow ne modifie pas le FlowData écrit"""
+        bus = DataBus()
+
+        flow = FlowData(
+            timestamp=datetime.now(),
+            flowrate=1000.0,
+            temperature=20.0,
+            source_node='influent'
+        )
+
+        bus.write_flow('node_1', flow)
+
+        assert bus.read_flow('node_1') is flow
+        assert flow.source_node == 'influent'
 
     def test_read_nonexistent_flow(self):
         """Test : lecture flux inexistant"""
@@ -339,6 +431,79 @@ class TestSimulationFlow:
 
         history = sim_flow.get_history('node_1')
         assert len(history) == 0
+        assert sim_flow.get_running_totals() == {}
+
+    def test_running_totals(self):
+        """Test : sommes cumulées tenues à jour à chaque ajout"""
+        sim_flow = SimulationFlow()
+
+        sim_flow.add_flow('node_1', FlowData(datetime.now(), 1000.0, 20.0, cod=100.0))
+        sim_flow.add_flow('node_1', FlowData(datetime.now(), 3000.0, 20.0, cod=300.0))
+
+        totals = sim_flow.get_running_totals()
+
+        assert totals == {'node_1': {'n': 2, 'flowrate': 4000.0, 'cod': 400.0, 'energy': 0.0}}
+
+    def test_add_flows_batch(self):
+        """Test : ajout groupé des flux d'un pas de temps"""
+        sim_flow = SimulationFlow()
+
+        sim_flow.add_flows({
+            'node_1': FlowData(datetime.now(), 1000.0, 20.0),
+            'node_2': FlowData(datetime.now(), 2000.0, 20.0)
+        })
+
+        assert sim_flow.get_latest('node_2').flowrate == 2000.0
+        assert sim_flow.get_running_totals()['node_1']['n'] == 1
+
+    def test_get_columns(self):
+        """Test : vue colonnes mémorisée jusqu'au prochain ajout"""
+        sim_flow = SimulationFlow()
+        sim_flow.add_flow('node_1', FlowData(datetime.now(), 1000.0, 20.0, cod=100.0))
+        sim_flow.add_flow('node_1', FlowData(datetime.now(), 2000.0, 20.0, cod=300.0))
+
+        table = sim_flow.get_columns('node_1', ('cod', 'flowrate_missing'))
+
+        np.testing.assert_allclose(table, [[100.0, 0.0], [300.0, 0.0]])
+        assert sim_flow.get_columns('node_1', ('cod', 'flowrate_missing')) is table
+
+        sim_flow.add_flow('node_1', FlowData(datetime.now(), 1000.0, 20.0, cod=200.0))
+        assert sim_flow.get_columns('node_1', ('cod',)).shape == (3, 1)
+        assert sim_flow.get_columns('unknown', ('cod',)).shape == (0, 1)
+
+    def test_get_columns_grows_incrementally(self):
+        """Test : les anciennes vues restent valides quand le tampon s'agrandit"""
+        sim_flow = SimulationFlow()
+        views = []
+        for i in range(40):
+            sim_flow.add_flow('node_1', FlowData(datetime.now(), 1000.0, 20.0, cod=float(i)))
+            views.append(sim_flow.get_columns('node_1', ('cod',)))
+
+        np.testing.assert_allclose(views[-1][:, 0], np.arange(40.0))
+        np.testing.assert_allclose(views[4][:, 0], np.arange(5.0))
+        assert not views[-1].flags.writeable
+
+    def test_max_history_keeps_recent_steps_and_full_totals(self):
+        """Test : historique borné, sommes cumulées sur toute la simulation"""
+        sim_flow = SimulationFlow(max_history=3)
+        for i in range(10):
+            sim_flow.add_flow('node_1', FlowData(datetime.now(), 1000.0, 20.0, cod=float(i)))
+            table = sim_flow.get_columns('node_1', ('cod',))
+            assert table[-1, 0] == float(i)
+
+            assert len(table) == min(i + 1, 3)
+
+        history = sim_flow.get_history('node_1')
+        assert [f.cod for f in history] == [7.0, 8.0, 9.0]
+        np.testing.assert_allclose(table[:, 0], [7.0, 8.0, 9.0])
+        assert len(sim_flow.export_to_dict()['node_1']) == 3
+        assert sim_flow.get_latest('node_1').cod == 9.0
+        assert sim_flow.get_running_totals()['node_1']['n'] == 10
+
+    @pytest.mark.parametrize('max_history', [0, 2.5, True])
+    def test_max_history_must_be_positive_int(self, max_history):
+        with pytest.raises(ValueError):
+            SimulationFlow(max_history=max_history)
 
 class TestODESolver:
     """Tests pour ODESolver"""
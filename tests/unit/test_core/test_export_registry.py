@@ -24,6 +24,37 @@ class TestExportStrategy:
         with pytest.raises(TypeError):
             ExportStrategy() # type: ignore
 
+    def test_subclass_requires_format_attributes(self):
+        """Test : une stratégie sans format_name/file_extension est refusée"""
+        with pytest.raises(TypeError, match='file_extension'):
+            class IncompleteStrategy(ExportStrategy):
+                format_name = 'txt'
+
+                def export(self, results, output_path, **kwargs):
+                    return output_path
+
+                def supports_node(self, node_type):
+                    return True
+
+    def test_abstract_subclass_skips_format_attributes(self):
+        """Test : une sous-classe abstraite intermédiaire n'a pas à définir format_name"""
+        class TabularStrategy(ExportStrategy):
+            def supports_node(self, node_type):
+                return True
+
+        class TxtStrategy(TabularStrategy):
+            format_name = 'txt'
+            file_extension = '.txt'
+
+            def export(self, results, output_path, **kwargs):
+                return output_path
+
+        assert TxtStrategy().format_name == 'txt'
+        with pytest.raises(TypeError, match='format_name'):
+            class NamelessStrategy(TabularStrategy):
+                def export(self, results, output_path, **kwargs):
+                    return output_path
+
 class TestCSVExportStrategy:
     """Tests pour CSVExportStrategy"""
 
@@ -116,6 +147,94 @@ class TestCSVExportStrategy:
         assert 'timestamp' in df.columns
         assert 'flowrate' in df.columns
 
+    def test_export_matches_row_by_row_layout(self):
+        """Test : colonnes fixes puis composants, un composant homonyme prévaut"""
+        from core.registries.export.strategies.base import flows_to_dataframe
+
+        flows = [
+            {'timestamp': 't0', 'flowrate': 1000.0, 'components': {'cod': 50.0, 'flowrate': 900.0}},
+            {'timestamp': 't1', 'flowrate': 1100.0, 'components': {'tss': 2000.0}}
+        ]
+
+        df = flows_to_dataframe(flows, ('timestamp', 'flowrate'))
+        expected = pd.DataFrame([
+            {'timestamp': f['timestamp'], 'flowrate': f['flowrate'], **f['components']}
+            for f in flows
+        ])
+
+        pd.testing.assert_frame_equal(df, expected)
+
+class TestExcelExportStrategy:
+    """Tests pour ExcelExportStrategy"""
+
+    def test_export_one_sheet_per_node(self, tmp_path):
+        """Test : une feuille de métadonnées puis une par noeud non vide"""
+        pytest.importorskip('openpyxl')
+        strategy = ExcelExportStrategy()
+
+        results = {
+            'metadata': {'sim_name': 'test'},
+            'history': {
+                'proc1': [{'timestamp': 't0', 'flowrate': 1000.0, 'components': {'cod': 50.0}}],
+                'empty': []
+            }
+        }
+
+        filepath = strategy.export(results, tmp_path, name='test')
+
+        sheets = pd.read_excel(filepath, sheet_name=None)
+        assert list(sheets) == ['Metadata', 'proc1']
+        assert list(sheets['proc1'].columns) == ['timestamp', 'flowrate', 'cod']
+
+    @pytest.mark.parametrize('engine', ['openpyxl', 'xlsxwriter'])
+    def test_export_multi_row_roundtrip(self, tmp_path, engine):
+        """Test : toutes les lignes et colonnes relues, quel que soit le moteur installé"""
+        pytest.importorskip(engine)
+        pytest.importorskip('openpyxl')  # relecture
+        strategy = ExcelExportStrategy()
+
+        flows = [
+            {
+                'timestamp': f't{i}',
+                'flowrate': 1000.0 + i,
+                'components': {'ss': 10.0 * i, 'xs': 100.0 + i}
+            }
+            for i in range(5)
+        ]
+        results = {'metadata': {'sim_name': 'test'}, 'history': {'proc1': flows}}
+
+        with patch('core.registries.export.strategies.excel._ENGINE', engine):
+            filepath = strategy.export(results, tmp_path, name='test')
+
+        df = pd.read_excel(filepath, sheet_name='proc1')
+        assert df['timestamp'].tolist() == [f't{i}' for i in range(5)]
+        assert df['flowrate'].tolist() == [1000.0 + i for i in range(5)]
+        assert df['ss'].tolist() == [10.0 * i for i in range(5)]
+        assert df['xs'].tolist() == [100.0 + i for i in range(5)]
+
+class TestParquetExportStrategy:
+    """Tests pour ParquetExportStrategy"""
+
+    def test_export_roundtrip(self, tmp_path):
+        """Test : export Parquet relisible avec les composants en colonnes"""
+        pytest.importorskip('pyarrow')
+        strategy = ParquetExportStrategy()
+
+        results = {
+            'history': {
+                'proc1': [
+                    {'timestamp': '2025-01-01T00:00:00', 'flowrate': 1000.0, 'components': {'cod': 50.0}},
+                    {'timestamp': '2025-01-01T00:10:00', 'flowrate': 1100.0, 'components': {'cod': 45.0}}
+                ]
+            }
+        }
+
+        filepath = strategy.export(results, tmp_path, node_id='proc1')
+
+        df = pd.read_parquet(filepath)
+        assert list(df.columns) == ['timestamp', 'flowrate', 'cod']
+        assert df['cod'].tolist() == [50.0, 45.0]
+
 class TestJSONExportStrategy:
     """Tests pour JSONExportStrategy"""
 
@@ -177,6 +296,29 @@ class TestJSONExportStrategy:
 
         assert 'metadata' in data
 
+    def test_export_matches_stdlib_json(self, tmp_path):
+        """Test : même contenu que json.dump(default=str), numpy compris"""
+        from datetime import datetime
+        import numpy as np
+
+        strategy = JSONExportStrategy()
+
+        results = {
+            'metadata': {'timestamp': datetime(2025, 1, 1, 12, 0, 0), 'steps': np.int64(3)},
+            'history': {
+                'proc1': [{'flowrate': np.float64(1000.5), 'components': {'cod': 50.0}}]
+            },
+            'statistics': {1: 'non-str key'}
+        }
+
+        filepath = strategy.export(results, tmp_path)
+
+        data = json.loads(filepath.read_text())
+        assert data['metadata']['timestamp'] == str(datetime(2025, 1, 1, 12, 0, 0))
+        assert data['metadata']['steps'] == 3
+        assert data['history']['proc1'][0] == {'flowrate': 1000.5, 'components': {'cod': 50.0}}
+        assert data['statistics'] == {'1': 'non-str key'}
+
 class TestExportRegistry:
     """Tests pour ExportRegistry"""
 
@@ -187,3 +329,47 @@ class TestExportRegistry:
 
         assert instance1 is instance2
         assert id(instance1) == id(instance2)
+
+    def test_default_strategies_built_on_first_use(self):
+        """Test : les stratégies par défaut sont construites au premier accès"""
+        registry = ExportRegistry()
+
+        assert registry.get_available_formats() == ['csv', 'json']
+        assert registry._strategies['csv'] is None
+
+        strategy = registry.get_strategy('CSV')
+
+        assert isinstance(strategy, CSVExportStrategy)
+        assert registry.get_strategy('csv') is strategy
+        assert registry._strategies['json'] is None
+
+    def test_strategy_modules_imported_on_demand(self):
+        """Test : importer le registre ne charge aucun module de stratégie"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from core.registries.export import ExportRegistry\n"
+            "prefix = 'core.registries.export.strategies.'\n"
+            "print(sorted(m[len(prefix):] for m in sys.modules if m.startswith(prefix)))\n"
+            "ExportRegistry().get_strategy('csv')\n"
+            "print(sorted(m[len(prefix):] for m in sys.modules if m.startswith(prefix)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parents[3]
+        )
+
+        assert result.stdout.splitlines() == ["['base']", "['base', 'csv']"]
+
+    def test_default_formats_read_once(self):
+        """Test : default_formats.json n'est lu qu'une fois"""
+        from core.registries.export import registry as export_registry
+
+        ExportRegistry()
+        hits = export_registry._load_default_formats.cache_info().hits
+        ExportRegistry()
+
+        assert export_registry._load_default_formats.cache_info().hits == hits + 1
@@ -151,3 +151,76 @@ class TestFractionationRegistry:
         assert call_kwargs['tss'] == 150.0
         assert call_kwargs.get('tkn') == 0.0
         assert call_kwargs.get('nh4') == 0.0
+
+    def test_default_strategies_built_lazily(self):
+        """Test: les stratégies par défaut sont construites au premier accès"""
+        from core.registries.fractionation.registry import FractionationRegistry
+
+        registry = FractionationRegistry()
+
+        assert registry.is_registered('ASM1')
+        assert 'ASM1' not in registry._strategies
+
+        strategy = registry.get_strategy('ASM1')
+
+        assert registry.get_strategy('ASM1MODEL') is strategy
+        assert 'ASM1' in registry.list_registered_models()
+
+    def test_fractionate_dispatch_follows_unregister(self):
+        """Test: la table de dispatch est vidée lors d'un désenregistrement"""
+        from core.registries.fractionation.registry import FractionationRegistry
+
+        registry = FractionationRegistry()
+
+        first = MagicMock()
+        first.fractionate.return_value = {'si': 1.0}
+        second = MagicMock()
+        second.fractionate.return_value = {'si': 2.0}
+
+        registry.register('DISPATCH_TEST', first)
+        assert registry.fractionate('dispatch_test', cod=100.0) == {'si': 1.0}
+
+        registry.unregister('DISPATCH_TEST')
+        registry.register('DISPATCH_TEST', second)
+
+        assert registry.fractionate('dispatch_test', cod=100.0) == {'si': 2.0}
+
+    def test_concurrent_first_get_strategy(self):
+        """Test: des premiers accès concurrents obtiennent la même instance"""
+        import threading
+        import time
+        from core.registries.fractionation import registry as fractionation_registry
+
+        built = []
+
+        def slow_builder():
+            time.sleep(0.05)
+            strategy = MagicMock()
+            built.append(strategy)
+            return strategy
+
+        with patch.dict(
+            fractionation_registry._STRATEGY_CONSTRUCTORS,
+            {'ASM1FractionationStrategy': slow_builder}
+        ):
+            registry = fractionation_registry.FractionationRegistry()
+            results, errors = [], []
+
+            def worker(model_type):
+                try:
+                    results.append(registry.get_strategy(model_type))
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [
+                threading.Thread(target=worker, args=('ASM1' if i % 2 else 'ASM1Model',))
+                for i in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert errors == []
+        assert len(built) == 1
+        assert all(strategy is built[0] for strategy in results)
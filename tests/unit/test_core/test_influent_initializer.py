@@ -4,7 +4,7 @@ Tests unitaires pour InfluentInitializer
 import pytest
 from datetime import datetime
 
-from core.orchestrator.influent_initializer import InfluentInitializer
+from core.orchestrator.influent_initializer import InfluentInitializer, InfluentSpec
 from core.data.flow_data import FlowData
 
 
@@ -61,6 +61,15 @@ class TestInfluentInitializerBasic:
         assert flow.po4        == pytest.approx(8.0)
         assert flow.alkalinity == pytest.approx(6.0)
 
+    def test_configured_values_not_clamped(self, caplog):
+        """Les valeurs configurées sont gardées telles quelles, négatifs compris."""
+        config = {'influent': {'composition': {'cod': -5.0, 'tss': -1.0}}}
+        with caplog.at_level('WARNING'):
+            flow = InfluentInitializer.create_from_config(config, TIMESTAMP)
+        assert flow.cod == -5.0
+        assert flow.tss == -1.0
+        assert caplog.records == []
+
 
 class TestInfluentInitializerDefaults:
 
@@ -124,3 +133,93 @@ class TestInfluentInitializerSSAlias:
         config = {'influent': {'flowrate': 1000.0, 'composition': {}}}
         flow = InfluentInitializer.create_from_config(config, TIMESTAMP)
         assert flow.tss == pytest.approx(0.0)
+
+
+class TestInfluentSpec:
+
+    def test_spec_parsed_once_and_reused(self):
+        """Une InfluentSpec donne le même flux que la config brute."""
+        from core.orchestrator.influent_initializer import InfluentSpec
+
+        spec = InfluentSpec.from_config(FULL_CONFIG)
+        from_spec = InfluentInitializer.create_from_config(spec, TIMESTAMP)
+        from_config = InfluentInitializer.create_from_config(FULL_CONFIG, TIMESTAMP)
+
+        assert from_spec.to_dict() == from_config.to_dict()
+
+    def test_spec_is_frozen(self):
+        from dataclasses import FrozenInstanceError
+        from core.orchestrator.influent_initializer import InfluentSpec
+
+        spec = InfluentSpec.from_config(FULL_CONFIG)
+        with pytest.raises(FrozenInstanceError):
+            spec.flowrate = 0.0
+
+
+class TestInfluentPreFractionated:
+
+    CONFIG = {
+        'influent': {
+            'auto_fractionate': False,
+            'composition': {'cod': 400.0, 'tss': 200.0, 'si': 30.0, 'ss': 80.0, 'xs': 200.0}
+        }
+    }
+
+    def test_model_components_kept_as_is(self):
+        """auto_fractionate=False → composants de modèle repris sans fractionnement."""
+        flow = InfluentInitializer.create_from_config(self.CONFIG, TIMESTAMP)
+        assert flow.components == {'si': 30.0, 'ss': 80.0, 'xs': 200.0}
+        assert flow.has_model_components()
+
+    def test_ss_is_not_tss_alias(self):
+        flow = InfluentInitializer.create_from_config(self.CONFIG, TIMESTAMP)
+        assert flow.tss == pytest.approx(200.0)
+        assert flow.cod == pytest.approx(400.0)
+
+    def test_ss_stays_tss_alias_without_tss(self):
+        """Config ML (config/test_ml.json) : 'ss' reste l'alias de 'tss'."""
+        config = {
+            'influent': {
+                'auto_fractionate': False,
+                'composition': {'cod': 500.0, 'ss': 250.0, 'nh4': 28.0, 'alkalinity': 6.0}
+            },
+            'processes': [{'node_id': 'bassin_ml', 'config': {'model': 'LinearModel'}}]
+        }
+        flow = InfluentInitializer.create_from_config(config, TIMESTAMP)
+        assert flow.tss == pytest.approx(250.0)
+        assert flow.components == {}
+
+    def test_only_target_model_components_kept(self):
+        config = {
+            'influent': {
+                'auto_fractionate': False,
+                'composition': {'cod': 400.0, 'ss': 120.0, 'si': 30.0, 'unknown': 1.0}
+            }
+        }
+        flow = InfluentInitializer.create_from_config(config, TIMESTAMP)
+        assert flow.tss == pytest.approx(120.0)
+        assert flow.components == {'si': 30.0}
+
+        spec = InfluentSpec.from_config(config, model_components=['unknown'])
+        assert dict(spec.components) == {'unknown': 1.0}
+
+    def test_default_model_resolved_from_process_definition(self):
+        """Sans 'model' dans la config : modèle par défaut de chaque définition de procédé."""
+        composition = {'cod': 400.0, 'tss': 200.0, 'si': 30.0, 'xs': 200.0}
+        settler_only = {
+            'influent': {'auto_fractionate': False, 'composition': composition},
+            'processes': [{'node_id': 'dec', 'type': 'SecondarySettlerProcess', 'config': {}}]
+        }
+        assert InfluentSpec.from_config(settler_only).components == ()
+
+        with_sludge = {
+            'influent': {'auto_fractionate': False, 'composition': composition},
+            'processes': settler_only['processes'] + [
+                {'node_id': 'bassin', 'type': 'ActivatedSludgeProcess', 'config': {}}
+            ]
+        }
+        assert dict(InfluentSpec.from_config(with_sludge).components) == {'si': 30.0, 'xs': 200.0}
+
+    def test_auto_fractionate_default_has_no_components(self):
+        flow = InfluentInitializer.create_from_config(FULL_CONFIG, TIMESTAMP)
+        assert flow.components == {}
@@ -1,13 +1,16 @@
 """
 Tests unitaires pour les calculateurs de métriques
-(HRTCalculator, SRTCalculator, SVICalculator, EnergyConsumptionCalculator)
+(HRTCalculator, SRTCalculator, SVICalculator, EnergyConsumptionCalculator,
+RemovalEfficiencyCalculator)
 """
 import pytest
+import numpy as np
 
 from core.registries.metrics.calculators.hrt import HRTCalculator
 from core.registries.metrics.calculators.srt import SRTCalculator
 from core.registries.metrics.calculators.svi import SVICalculator
 from core.registries.metrics.calculators.energy import EnergyConsumptionCalculator
+from core.registries.metrics.calculators.removal import RemovalEfficiencyCalculator
 
 
 # ===========================================================================
@@ -260,3 +263,59 @@ class TestEnergyConsumptionCalculator:
         total_volume = 500.0 * 2.0
         expected = result['aeration_energy_kwh'] / total_volume
         assert result['energy_per_m3'] == pytest.approx(expected)
+
+
+# ===========================================================================
+# RemovalEfficiencyCalculator
+# ===========================================================================
+
+class TestRemovalEfficiencyCalculator:
+
+    @pytest.fixture
+    def calc(self):
+        return RemovalEfficiencyCalculator('cod_in', 'cod')
+
+    def test_normal_calculation(self, calc):
+        result = calc.calculate({'cod': 50.0}, {'cod_in': 500.0}, {})
+        assert result['efficiency'] == pytest.approx(90.0)
+
+    def test_missing_input_returns_independent_zero(self, calc):
+        """value_in nul → 0 %, chaque appel renvoie son propre dict."""
+        first = calc.calculate({'cod': 50.0}, {}, {})
+        first['efficiency'] = 42.0
+        assert calc.calculate({'cod': 50.0}, {}, {}) == {'efficiency': 0.0}
+
+
+# ===========================================================================
+# calculate_batch — cohérence avec calculate() pas à pas
+# ===========================================================================
+
+class TestCalculateBatch:
+
+    # Colonnes couvrant les cas limites : débit nul, MLSS faible, clip min/max
+    COMPONENTS = {'tss': np.array([3000.0, 0.0, 50.0, 3000.0, 20000.0])}
+    INPUTS = {
+        'flowrate':        np.array([1000.0, 0.0, 1000.0, 10.0, 1000.0]),
+        'cod_soluble_in':  np.array([300.0, 300.0, 100.0, 300.0, 300.0]),
+        'cod_soluble_out': np.array([30.0, 30.0, 300.0, 30.0, 30.0]),
+        'tss':             np.array([2500.0, 2500.0, 2500.0, 2500.0, 2500.0]),
+    }
+    CONTEXT = {'volume': 5000.0, 'waste_ratio': 0.01, 'dt': 0.1}
+
+    @pytest.mark.parametrize('calc', [
+        HRTCalculator(),
+        SRTCalculator(),
+        SVICalculator(),
+        EnergyConsumptionCalculator(),
+    ], ids=['hrt', 'srt', 'svi', 'energy'])
+    def test_batch_matches_scalar(self, calc):
+        batch = calc.calculate_batch(self.COMPONENTS, self.INPUTS, self.CONTEXT)
+
+        for i in range(len(self.INPUTS['flowrate'])):
+            scalar = calc.calculate(
+                {k: float(v[i]) for k, v in self.COMPONENTS.items()},
+                {k: float(v[i]) for k, v in self.INPUTS.items()},
+                self.CONTEXT
+            )
+            for key, value in scalar.items():
+                assert batch[key][i] == pytest.approx(value), f"{key}[{i}]"
@@ -17,6 +17,20 @@ class TestMetricsRegistry:
         assert instance1 is instance2
         assert id(instance1) == id(instance2)
 
+    def test_singleton_concurrent_first_access(self):
+        """Test: un seul registre créé lors d'accès concurrents"""
+        from concurrent.futures import ThreadPoolExecutor
+        from core.registries.metrics.registry import MetricsRegistry
+
+        previous = MetricsRegistry._instance
+        MetricsRegistry._instance = None
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                instances = list(pool.map(lambda _: MetricsRegistry.get_instance(), range(16)))
+            assert all(inst is instances[0] for inst in instances)
+        finally:
+            MetricsRegistry._instance = previous
+
     def test_register_calculator(self):
         """Test: Enregistrement d'un novueau calculateur de métrique"""
         from core.registries.metrics.registry import MetricsRegistry
@@ -282,3 +296,86 @@ class TestCompositionCalculators:
         result = registry.calculate('cod', components, {}, {})
 
         assert result == {'value': 250.0}
+
+    def test_composite_calculator_batch(self):
+        """Test : Calculateur composite sur des colonnes numpy"""
+        import numpy as np
+        from core.registries.metrics.calculators import CompositeMetricCalculator
+
+        calculator = CompositeMetricCalculator(['si', 'ss', 'xi'])
+
+        components = {
+            'si': np.array([25.0, 30.0]),
+            'ss': np.array([25.0, 10.0]),
+            'xs': np.array([100.0, 100.0])
+        }
+
+        result = calculator.calculate_batch(components, {}, {})
+
+        np.testing.assert_allclose(result['value'], [50.0, 40.0])
+        assert calculator.calculate_batch({'xs': np.ones(3)}, {}, {})['value'].shape == (3,)
+
+    def test_registry_calculate_batch_falls_back_to_scalar(self):
+        """Test : calculate_batch pas à pas pour un calculateur sans version vectorisée"""
+        import numpy as np
+        from core.registries.metrics.registry import MetricsRegistry
+        from core.registries.metrics.calculators import MetricCalculator
+
+        class DoubleFlow(MetricCalculator):
+            def calculate(self, components, inputs, context):
+                return {'double_flow': inputs['flowrate'] * 2}
+
+        registry = MetricsRegistry.get_instance()
+        if not registry.is_registered('double_flow'):
+            registry.register('double_flow', DoubleFlow())
+
+        result = registry.calculate_batch(
+            'double_flow', {}, {'flowrate': np.array([1.0, 2.0, 3.0])}, {'dt': 0.1}
+        )
+
+        np.testing.assert_allclose(result['double_flow'], [2.0, 4.0, 6.0])
+
+    def test_composite_component_names_interned(self):
+        """Test : les noms de composants sont internés à la construction"""
+        import sys
+        from core.registries.metrics.calculators import CompositeMetricCalculator
+
+        name = ''.join(['x', 'ba'])
+        calculator = CompositeMetricCalculator([name])
+
+        assert calculator.component_names == ('xba',)
+        assert calculator.component_names[0] is sys.intern('xba')
+
+class TestModelMetricsPlan:
+    """Tests pour le plan de calcul par modèle"""
+
+    def test_plan_follows_registration_changes(self):
+        """Test : le plan est recalculé après modification des associations"""
+        from core.registries.metrics.registry import MetricsRegistry
+
+        registry = MetricsRegistry()
+
+        first = MagicMock()
+        first.calculate.return_value = {'first': 1.0}
+        second = MagicMock()
+        second.calculate.return_value = {'second': 2.0}
+
+        registry.register('plan_first', first)
+        registry.register_model_metrics('PlanModel', ['plan_first'])
+        assert registry.calculate_all_for_model('PlanModel', {}, {}, {}) == {'first': 1.0}
+
+        registry.register('plan_second', second)
+        registry.register_model_metrics('PlanModel', ['plan_first', 'plan_second'])
+        assert registry.calculate_all_for_model('PlanModel', {}, {}, {}) == {
+            'first': 1.0, 'second': 2.0
+        }
+
+    def test_plan_with_unregistered_metric_raises(self):
+        """Test : une métrique non enregistrée dans le plan lève une erreur"""
+        from core.registries.metrics.registry import MetricsRegistry
+
+        registry = MetricsRegistry()
+        registry.register_model_metrics('PlanModel', ['plan_missing'])
+
+        with pytest.raises(ValueError, match='not registered'):
+            registry.calculate_all_for_model('PlanModel', {}, {}, {})
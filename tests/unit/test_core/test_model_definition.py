@@ -0,0 +1,106 @@
+"""
+Tests unitaires pour ModelDefinition
+"""
+import pytest
+
+from core.model.model_definition import ModelDefinition
+
+
+@pytest.fixture
+def definition_data():
+    return {
+        'id': 'test',
+        'type': 'TestModel',
+        'name': 'Modèle de test',
+        'description': 'Test',
+        'category': 'empirical',
+        'components_count': 2,
+        'processes_count': 1,
+        'default_temperature': 20.0,
+        'parameters': [
+            {'id': 'mu_h', 'label': 'Croissance', 'unit': '1/d', 'default': 6.0},
+            {'id': 'k_s', 'label': 'Demi-saturation', 'unit': 'mg/L', 'default': 20.0}
+        ],
+        'components': [
+            {'id': 'si', 'name': 'DCO soluble inerte'},
+            {'id': 'ss', 'name': 'Substrat soluble'}
+        ],
+        'metrics': {'cod': ['si', 'ss']},
+        'module': 'models.empyrical.asm1.model',
+        'class': 'ASM1Model'
+    }
+
+
+class TestModelDefinition:
+    """Tests pour ModelDefinition"""
+
+    def test_components_queries(self, definition_data):
+        """Test : noms et dictionnaire de composants"""
+        definition = ModelDefinition.from_dict(definition_data)
+
+        assert definition.get_components_names() == ['si', 'ss']
+        assert definition.get_components_dict() == {
+            'si': 'DCO soluble inerte',
+            'ss': 'Substrat soluble'
+        }
+
+    def test_components_dict_is_shared_read_only_view(self, definition_data):
+        """Test : le dictionnaire de composants est précalculé et non modifiable"""
+        definition = ModelDefinition.from_dict(definition_data)
+        components = definition.get_components_dict()
+
+        assert definition.get_components_dict() is components
+        with pytest.raises(TypeError):
+            components['xi'] = 'DCO particulaire inerte'
+
+    def test_parameters_queries(self, definition_data):
+        """Test : paramètres et valeurs par défaut"""
+        definition = ModelDefinition.from_dict(definition_data)
+
+        assert definition.get_default_params() == {'mu_h': 6.0, 'k_s': 20.0}
+        assert definition.get_param_dict()['k_s'].unit == 'mg/L'
+
+    def test_queries_return_independent_copies(self, definition_data):
+        """Test : modifier le résultat d'une requête n'altère pas la définition"""
+        definition = ModelDefinition.from_dict(definition_data)
+
+        definition.get_default_params()['mu_h'] = 0.0
+        definition.get_components_names().append('xi')
+
+        assert definition.get_default_params()['mu_h'] == 6.0
+        assert definition.get_components_names() == ['si', 'ss']
+
+    def test_get_class_shared_across_definitions(self, definition_data):
+        """Test : la classe résolue est partagée entre définitions"""
+        first = ModelDefinition.from_dict(definition_data)
+        second = ModelDefinition.from_dict(definition_data)
+
+        assert first.get_class() is second.get_class()
+        assert first.get_class().__name__ == 'ASM1Model'
+
+    def test_get_class_invalid_raises_import_error(self, definition_data):
+        """Test : classe introuvable → ImportError"""
+        definition_data['class'] = 'Inexistant'
+        definition = ModelDefinition.from_dict(definition_data)
+
+        with pytest.raises(ImportError):
+            definition.get_class()
+
+    def test_definitions_use_slots(self, definition_data):
+        """Test : pas de __dict__ par instance (slots)"""
+        definition = ModelDefinition.from_dict(definition_data)
+
+        assert not hasattr(definition, '__dict__')
+        assert not hasattr(definition.parameters[0], '__dict__')
+        with pytest.raises(AttributeError):
+            definition.parameters[0].extra = 1.0
+
+    def test_from_dict_without_category_and_metrics(self, definition_data):
+        """Test : une entrée sans category ni metrics reste valide"""
+        del definition_data['category']
+        del definition_data['metrics']
+
+        definition = ModelDefinition.from_dict(definition_data)
+
+        assert definition.category == ''
+        assert definition.get_metrics_dict() == {}
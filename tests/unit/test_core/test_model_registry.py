@@ -0,0 +1,81 @@
+"""
+Tests unitaires pour ModelRegistry
+"""
+import pytest
+
+from core.model.model_registry import ModelRegistry
+
+
+@pytest.fixture
+def registry():
+    """Registre neuf sur le catalogue par défaut (hors singleton)"""
+    return ModelRegistry(None)
+
+
+class TestModelRegistry:
+    """Tests pour le registre de modèles"""
+
+    def test_definitions_built_on_demand(self, registry):
+        """Test : les définitions sont construites au premier accès"""
+        assert 'ASM1Model' in registry.get_model_types()
+        assert 'ASM1Model' not in registry.models
+
+        definition = registry.get_model_definition('ASM1Model')
+
+        assert registry.models['ASM1Model'] is definition
+        assert registry.get_model_definition('ASM1Model') is definition
+
+    def test_unknown_model_raises(self, registry):
+        """Test : type inconnu → ValueError listant les types disponibles"""
+        with pytest.raises(ValueError, match='ASM1Model'):
+            registry.get_model_definition('Inexistant')
+
+    def test_catalog_order_preserved(self, registry):
+        """Test : l'ordre du catalogue est conservé"""
+        types = registry.get_model_types()
+        listed = [d.type for d in registry.list_models()]
+
+        assert sorted(types) == sorted(listed)
+        assert registry.get_mechanistric_models() == [
+            t for t in types if registry.get_model_definition(t).category == 'empirical'
+        ]
+        assert registry.get_mechanistic_models() == registry.get_mechanistric_models()
+        assert registry.get_ml_models() == [
+            t for t in types if registry.get_model_definition(t).category == 'machine_learning'
+        ]
+
+    def test_rebuild_reuses_parsed_catalog(self):
+        """Test : un registre reconstruit réutilise le json déjà lu"""
+        from utils import json_utils
+
+        ModelRegistry(None)
+        hits = json_utils.read_json_cached.cache_info().hits
+        ModelRegistry(None)
+
+        assert json_utils.read_json_cached.cache_info().hits > hits
+
+    def test_definitions_shared_between_registries(self, registry):
+        """Test : un catalogue inchangé donne les mêmes définitions"""
+        other = ModelRegistry(None)
+
+        assert other.get_model_definition('ASM1Model') is registry.get_model_definition('ASM1Model')
+
+    def test_cli_format_memoized(self, registry):
+        """Test : le format CLI est construit une seule fois"""
+        cli = registry.to_cli_format()
+
+        assert registry.to_cli_format() is cli
+        assert [m['type'] for m in cli.values()] == registry.get_model_types()
+
+    def test_singleton_concurrent_first_access(self):
+        """Test : un seul registre créé lors d'accès concurrents"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        previous = ModelRegistry._instance
+        ModelRegistry._instance = None
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                instances = list(pool.map(lambda _: ModelRegistry.get_instance(), range(16)))
+            assert all(inst is instances[0] for inst in instances)
+        finally:
+            ModelRegistry._instance = previous
@@ -146,6 +146,92 @@ class TestSimulationOrchestrator:
         assert mock_proc1.process.call_count == 1
 
 
+    def test_schedule_resolved_once(self):
+        """Test : la topologie n'est pas recalculée à chaque pas"""
+        config = {
+            'name': 'test',
+            'simulation': {
+                'start_time': '2025-12-11T00:00:00',
+                'end_time': '2025-12-11T01:00:00',
+                'timestep_hours': 0.1
+            },
+            'influent': {'flowrate': 1000.0, 'temperature': 20.0},
+            'processes': [],
+            'connections': [{'source': 'influent', 'target': 'proc1'}]
+        }
+        orchestrator = SimulationOrchestrator(config)
+
+        mock_proc = MagicMock()
+        mock_proc.node_id = 'proc1'
+        mock_proc.process.return_value = {'flowrate': 1000.0}
+        orchestrator.add_process(mock_proc)
+        orchestrator.initialize()
+
+        with patch.object(
+            orchestrator.connection_manager, 'get_execution_order',
+            wraps=orchestrator.connection_manager.get_execution_order
+        ) as order:
+            orchestrator._run_timestep()
+            orchestrator._run_timestep()
+
+        assert order.call_count == 1
+        assert mock_proc.process.call_count == 2
+
+    def test_mix_multiple_sources_weighted_by_flowrate(self):
+        """Test : mélange pondéré par les débits, flux sources non modifiés"""
+        from datetime import datetime
+        from core.connection.connection import Connection
+        from core.data.flow_data import FlowData
+
+        orchestrator = SimulationOrchestrator({
+            'name': 'test',
+            'simulation': {
+                'start_time': '2025-12-11T00:00:00',
+                'end_time': '2025-12-11T01:00:00',
+                'timestep_hours': 0.1
+            }
+        })
+        a = FlowData(datetime.now(), 1000.0, 10.0, components={'ss': 100.0, 'xs': 50.0})
+        b = FlowData(datetime.now(), 3000.0, 30.0, components={'ss': 20.0, 'snh': 8.0})
+        orchestrator.databus.write_flow('a', a)
+        orchestrator.databus.write_flow('b', b)
+
+        mixed = orchestrator._mix_multiple_sources([
+            ('a', Connection('a', 'mix', 1.0, False)),
+            ('b', Connection('b', 'mix', 0.5, False))
+        ])
+
+        assert mixed['flowrate'] == pytest.approx(2500.0)
+        assert mixed['temperature'] == pytest.approx(22.0)
+        assert mixed['components'] == pytest.approx({'ss': 52.0, 'xs': 20.0, 'snh': 4.8})
+        assert a.components == {'ss': 100.0, 'xs': 50.0}
+
+    def test_create_output_flow_splits_components_and_metrics(self):
+        """Test : composants repris tels quels, métriques séparées, mesures en attributs"""
+        orchestrator = SimulationOrchestrator({
+            'name': 'test',
+            'simulation': {
+                'start_time': '2025-12-11T00:00:00',
+                'end_time': '2025-12-11T01:00:00',
+                'timestep_hours': 0.1
+            }
+        })
+        process = MagicMock()
+        process.node_id = 'proc1'
+        components = {'ss': 5.0, 'xbh': 2000.0}
+        outputs = {
+            'flowrate': 900.0, 'temperature': 18.0, 'model_type': 'ASM1',
+            'components': components, 'underflow': {'flowrate': 100.0},
+            'cod': 45.0, 'srt_days': 12.0, 'ss': 99.0
+        }
+
+        flow = orchestrator._create_output_flow(process, outputs)
+
+        assert flow.components is components
+        assert flow.metrics == {'cod': 45.0, 'srt_days': 12.0}
+        assert flow.cod == 45.0
+        assert flow.source_node == 'proc1'
+
     @patch('core.orchestrator.simulation_orchestrator.InfluentInitializer')
     def test_run_advances_time(self, MockInfluent):
         """Test : run avance le temps"""
@@ -173,6 +259,62 @@ class TestSimulationOrchestrator:
 
         assert orchestrator.state.current_time > initial_time
 
+class TestOrchestratorState:
+    """Tests OrchestratorState"""
+
+    def test_remaining_steps_matches_time_loop(self):
+        """Test : le nombre de pas couvre un dernier pas partiel, comme la boucle sur current_time"""
+        from datetime import datetime
+        from core.orchestrator.orchestrator_state import OrchestratorState
+
+        state = OrchestratorState(
+            start_time=datetime(2025, 12, 11, 0, 0),
+            end_time=datetime(2025, 12, 11, 0, 10),
+            timestep_hours=0.1
+        )
+
+        assert state.remaining_steps() == 2
+
+        state.advance()
+        assert state.current_time == datetime(2025, 12, 11, 0, 6)
+        assert state.remaining_steps() == 1
+
+        state.advance()
+        assert state.remaining_steps() == 0
+
+    def test_simulation_config_parsed_once(self):
+        """Test : SimulationConfig extrait bornes et pas de temps"""
+        from datetime import datetime, timedelta
+        from core.orchestrator.orchestrator_state import SimulationConfig
+
+        sim_config = SimulationConfig.from_config({
+            'simulation': {
+                'start_time': '2025-12-11T00:00:00',
+                'end_time': '2025-12-11T06:00:00',
+                'timestep_hours': 0.5
+            }
+        })
+
+        assert sim_config.start_time == datetime(2025, 12, 11)
+        assert sim_config.end_time == datetime(2025, 12, 11, 6)
+        assert sim_config.timestep_td == timedelta(minutes=30)
+        assert sim_config.history_max_steps is None
+
+    @pytest.mark.parametrize('history_max_steps', [0, -1, 2.5, '10', True])
+    def test_simulation_config_rejects_invalid_history_max_steps(self, history_max_steps):
+        """Test : history_max_steps doit être un entier >= 1, vérifié au chargement"""
+        from core.orchestrator.orchestrator_state import SimulationConfig
+
+        with pytest.raises(ValueError, match='history_max_steps'):
+            SimulationConfig.from_config({
+                'simulation': {
+                    'start_time': '2025-12-11T00:00:00',
+                    'end_time': '2025-12-11T06:00:00',
+                    'timestep_hours': 0.5,
+                    'history_max_steps': history_max_steps
+                }
+            })
+
 class TestProcessFactory:
     """Tests ProcessFactory"""
 
@@ -237,4 +379,81 @@ class TestProcessFactory:
         with patch.object(ProcessFactory, '_setup_connections') as mock_setup:
             processes = ProcessFactory.create_from_config(config)
 
-            mock_setup.assert_called_once()
\ No newline at end of file
+            mock_setup.assert_called_once()
+
+    def test_setup_connections_rejects_unmarked_cycle(self):
+        """Test : un cycle non marqué comme recyclage échoue à la construction"""
+        processes = []
+        for node_id in ('p1', 'p2'):
+            process = MagicMock()
+            process.node_id = node_id
+            processes.append(process)
+
+        config = {
+            'connections': [
+                {'source': 'influent', 'target': 'p1'},
+                {'source': 'p1', 'target': 'p2'},
+                {'source': 'p2', 'target': 'p1', 'fraction': 0.5}
+            ]
+        }
+
+        with pytest.raises(ValueError, match="Cycle détecté.*'p1', 'p2'"):
+            ProcessFactory._setup_connections(processes, config)
+
+        config['connections'][2]['is_recycle'] = True
+        ProcessFactory._setup_connections(processes, config)
+
+    def test_sequential_chain_links_consecutive_processes(self):
+        """Test : sans connexions, les procédés sont chaînés dans l'ordre"""
+        from core.connection.connection_manager import ConnectionManager
+
+        processes = []
+        for node_id in ('p1', 'p2', 'p3'):
+            process = MagicMock()
+            process.node_id = node_id
+            processes.append(process)
+
+        manager = ConnectionManager()
+        ProcessFactory._create_sequentiel_chain(processes, manager)
+
+        assert manager.get_execution_order() == ['influent', 'p1', 'p2', 'p3']
+        processes[1].connect_upstream.assert_called_once_with('p1')
+        processes[1].connect_downstream.assert_called_once_with('p3')
+
+    @pytest.mark.parametrize('count', [2, 12])
+    @patch('core.process.process_factory.ProcessRegistry')
+    def test_create_from_config_keeps_config_order(self, MockRegistry, count):
+        """Test : création séquentielle ou parallèle, l'ordre de la config est conservé"""
+        mock_registry = MagicMock()
+        MockRegistry.get_instance.return_value = mock_registry
+        mock_registry.create_process.side_effect = lambda **kwargs: kwargs['node_id']
+
+        config = {
+            'processes': [
+                {'node_id': f'p{i}', 'type': 'ActivatedSludgeProcess', 'name': f'p{i}'}
+                for i in range(count)
+            ]
+        }
+
+        with patch.object(ProcessFactory, '_setup_connections'):
+            processes = ProcessFactory.create_from_config(config)
+
+        assert processes == [f'p{i}' for i in range(count)]
+
+    def test_setup_connections_skips_graph_rendering_when_info_disabled(self):
+        """Test : le rendu ASCII n'est construit que si le log INFO est actif"""
+        import logging
+
+        process = MagicMock()
+        process.node_id = 'p1'
+        config = {'connections': [{'source': 'influent', 'target': 'p1'}]}
+
+        with patch('core.process.process_factory.logger') as mock_logger, \
+                patch('core.process.process_factory.ConnectionManager.visualize_ascii') as mock_render:
+            mock_logger.isEnabledFor.return_value = False
+            ProcessFactory._setup_connections([process], config)
+
+            mock_logger.isEnabledFor.assert_called_with(logging.INFO)
+            mock_render.assert_not_called()
+
+        process.connect_upstream.assert_called_once_with('influent')
@@ -0,0 +1,75 @@
+"""
+Tests unitaires pour ProcessDefinition
+"""
+import pytest
+
+from core.process.process_definition import ProcessDefinition
+
+
+@pytest.fixture
+def definition():
+    return ProcessDefinition.from_dict({
+        'id': 'test',
+        'type': 'TestProcess',
+        'name': 'Procédé de test',
+        'description': 'Test',
+        'category': 'biological',
+        'model': 'ASM1Model',
+        'has_model_choice': True,
+        'required_params': [
+            {'name': 'volume', 'label': 'Volume', 'unit': 'm³', 'default': 5000.0}
+        ],
+        'optional_params': [
+            {'name': 'waste_ratio', 'label': 'Purge', 'unit': '-', 'default': 0.01}
+        ],
+        'module': 'processes.test',
+        'class': 'TestProcess'
+    })
+
+
+def test_default_config_merges_required_and_optional(definition):
+    assert definition.get_default_config() == {'volume': 5000.0, 'waste_ratio': 0.01}
+    assert list(definition.get_all_params()) == ['volume', 'waste_ratio']
+
+
+def test_default_config_is_an_independent_copy(definition):
+    """La config retournée est complétée par l'appelant : le cache ne doit pas bouger."""
+    config = definition.get_default_config()
+    config['volume'] = 1.0
+    definition.get_all_params().clear()
+
+    assert definition.get_default_config()['volume'] == 5000.0
+    assert 'waste_ratio' in definition.get_all_params()
+
+
+def test_class_imported_only_on_demand(definition):
+    """Le module du procédé n'est importé qu'à get_class (ici introuvable)."""
+    assert definition._class_cache is None
+    with pytest.raises(ImportError):
+        definition.get_class()
+
+
+def test_class_resolution_shared_between_definitions(definition):
+    from dataclasses import replace
+    from core.connection.connection import Connection
+
+    first = replace(definition, module='core.connection.connection', class_name='Connection')
+    second = replace(definition, module='core.connection.connection', class_name='Connection')
+
+    assert first.get_class() is Connection
+    assert second.get_class() is first.get_class()
+
+
+def test_parameters_are_immutable():
+    from dataclasses import FrozenInstanceError
+    from core.process.process_parameter import ProcessParameter
+
+    param = ProcessParameter.from_dict({
+        'name': 'model', 'label': 'Modèle', 'type': 'choice', 'choices': ['ASM1', 'ASM2d']
+    })
+
+    assert param.choices == ('ASM1', 'ASM2d')
+    assert param.is_choice()
+    assert not hasattr(param, '__dict__')
+    with pytest.raises(FrozenInstanceError):
+        param.default = 'ASM1'
@@ -0,0 +1,67 @@
+"""
+Tests unitaires pour ProcessRegistry
+"""
+import pytest
+
+from core.process.process_registry import ProcessRegistry
+
+
+@pytest.fixture
+def registry():
+    """Registre neuf sur le catalogue par défaut (hors singleton)"""
+    return ProcessRegistry(None)
+
+
+class TestProcessRegistry:
+    """Tests pour le registre de procédés"""
+
+    def test_rebuild_reuses_parsed_catalog(self):
+        """Test : un registre reconstruit ne relit pas les fichiers json"""
+        from utils import json_utils
+
+        ProcessRegistry(None)
+        hits = json_utils.read_definition_cached.cache_info().hits
+        ProcessRegistry(None)
+
+        assert json_utils.read_definition_cached.cache_info().hits > hits
+        assert json_utils.read_definition_cached.cache_info().maxsize is not None
+
+    def test_definitions_shared_between_registries(self, registry):
+        """Test : un catalogue inchangé donne les mêmes définitions"""
+        other = ProcessRegistry(None)
+
+        for process_type in registry.get_process_types():
+            assert other.get_process_definition(process_type) is registry.get_process_definition(process_type)
+
+    def test_categories_loaded_from_categories_file(self, registry):
+        assert 'biological' in registry.list_categories()
+
+    def test_unknown_process_raises(self, registry):
+        with pytest.raises(ValueError, match='Inexistant'):
+            registry.get_process_definition('Inexistant')
+
+    def test_singleton_concurrent_first_access(self):
+        """Test : un seul registre créé lors d'accès concurrents"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        previous = ProcessRegistry._instance
+        ProcessRegistry._instance = None
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                instances = list(pool.map(lambda _: ProcessRegistry.get_instance(), range(16)))
+            assert all(inst is instances[0] for inst in instances)
+        finally:
+            ProcessRegistry._instance = previous
+
+    def test_cli_formats_memoized(self, registry):
+        """Test : formats CLI construits une fois, reconstruits au rechargement"""
+        cli = registry.to_cli_format()
+        defaults = registry.to_default_params()
+
+        assert registry.to_cli_format() is cli
+        assert registry.to_default_params() is defaults
+        assert [p['type'] for p in cli.values()] == registry.get_process_types()
+
+        registry._load_catalog()
+        assert registry.to_cli_format() is not cli
+        assert registry.to_default_params() == defaults
@@ -103,6 +103,21 @@ class TestResultManagerCollect:
         result = rm.collect(SAMPLE_METADATA)
         assert result['statistics']['proc1']['num_samples'] == 7
 
+    def test_collect_statistics_values(self):
+        """Moyennes, extrêmes et SRT infini exclu de la moyenne."""
+        sf = SimulationFlow()
+        sf.add_flow('proc1', _make_process_flow(cod_soluble=20.0, flowrate=800.0, srt=10.0))
+        sf.add_flow('proc1', _make_process_flow(cod_soluble=40.0, flowrate=1200.0, srt=float('inf')))
+
+        stats = ResultManager(sf).collect(SAMPLE_METADATA)['statistics']['proc1']
+
+        assert stats['avg_flowrate'] == pytest.approx(1000.0)
+        assert stats['avg_cod_soluble'] == pytest.approx(30.0)
+        assert stats['min_cod_soluble'] == pytest.approx(20.0)
+        assert stats['max_cod_soluble'] == pytest.approx(40.0)
+        assert stats['avg_srt_days'] == pytest.approx(10.0)
+        assert stats['total_energy_kwh'] == pytest.approx(100.0)
+
     def test_collect_summary_has_sections(self):
         rm = ResultManager(_make_sim_flow())
         result = rm.collect(SAMPLE_METADATA)
@@ -115,6 +130,32 @@ class TestResultManagerCollect:
         result = rm.collect(SAMPLE_METADATA)
         assert 'proc1' in result['summary']['performance']
 
+    def test_collect_summary_economic_matches_statistics(self):
+        """Le bilan économique réutilise l'énergie totale des statistiques."""
+        rm = ResultManager(_make_sim_flow(n_steps=4))
+        result = rm.collect(SAMPLE_METADATA)
+        economic = result['summary']['economic']['proc1']
+        assert economic['total_energy_kwh'] == pytest.approx(
+            result['statistics']['proc1']['total_energy_kwh']
+        )
+        assert economic['estimated_cost_eur'] == pytest.approx(4 * 50.0 * 0.15)
+        # Volume : 4 pas × 1000 m³/h × 1/60
+        assert economic['total_volume_m3'] == pytest.approx(4 * 1000.0 / 60)
+
+    def test_bounded_history_keeps_run_totals(self):
+        """Historique borné : énergie totale sur toute la simulation, min/max sur les K derniers pas."""
+        sf = SimulationFlow(max_history=3)
+        for i in range(10):
+            sf.add_flow('proc1', _make_process_flow(cod_soluble=float(i)))
+        result = ResultManager(sf).collect(SAMPLE_METADATA)
+
+        stats = result['statistics']['proc1']
+        assert stats['num_samples'] == 10
+        assert stats['total_energy_kwh'] == pytest.approx(10 * 50.0)
+        assert result['summary']['economic']['proc1']['total_energy_kwh'] == pytest.approx(10 * 50.0)
+        assert stats['min_cod_soluble'] == pytest.approx(7.0)
+        assert len(result['history']['proc1']) == 3
+
     def test_collect_ignores_influent_in_summary(self):
         rm = ResultManager(_make_sim_flow())
         result = rm.collect(SAMPLE_METADATA)
@@ -178,6 +219,60 @@ class TestResultManagerSave:
             data = json.load(f)
         assert 'history' not in data
 
+    def test_save_serializes_numpy_and_datetime(self, tmp_path):
+        """Scalaires numpy et datetime sérialisés comme avec str()."""
+        rm = ResultManager(_make_sim_flow())
+        rm.collect({**SAMPLE_METADATA, 'created': TIMESTAMP})
+        full_path = rm.save(str(tmp_path))
+        with open(full_path) as f:
+            data = json.load(f)
+        assert data['metadata']['created'] == str(TIMESTAMP)
+        assert data['statistics']['proc1']['avg_biomass'] == pytest.approx(2500.0)
+
+    def test_save_async_writes_both_files(self, tmp_path):
+        """save_async retourne un Future vers le fichier complet."""
+        rm = ResultManager(_make_sim_flow())
+        rm.collect(SAMPLE_METADATA)
+        full_path = rm.save_async(str(tmp_path / 'async')).result(timeout=10)
+        assert full_path.exists()
+        assert len(list((tmp_path / 'async').glob('*.json'))) == 2
+
+    def test_save_streams_same_content_as_single_dump(self, tmp_path):
+        """Écriture noeud par noeud : contenu identique à un encodage unique."""
+        from core.orchestrator.result_manager import _dumps
+
+        rm = ResultManager(_make_sim_flow(n_steps=3))
+        rm.collect(SAMPLE_METADATA)
+        full_path = rm.save(str(tmp_path))
+        assert full_path.name.endswith('_full.json')
+        assert full_path.read_bytes() == _dumps(rm.results)
+
+        summary_path = list(tmp_path.glob('*_summary.json'))[0]
+        assert summary_path.read_bytes() == _dumps(
+            {key: rm.results[key] for key in ('metadata', 'statistics', 'summary')}
+        )
+
+    def test_save_ndjson_history_round_trip(self, tmp_path):
+        """Historique en ndjson : une ligne par pas, relu à l'identique."""
+        rm = ResultManager(_make_sim_flow(n_steps=4))
+        rm.collect(SAMPLE_METADATA)
+        full_path = rm.save(str(tmp_path), history_format='ndjson')
+        with open(full_path) as f:
+            data = json.load(f)
+        assert 'history' not in data
+        assert set(data['history_files']) == {'influent', 'proc1'}
+        lines = (tmp_path / data['history_files']['proc1']).read_text().splitlines()
+        assert len(lines) == 4
+        assert ResultManager.load_history(full_path) == json.loads(
+            json.dumps(rm.results['history'], default=str)
+        )
+
+    def test_save_unknown_history_format_raises(self, tmp_path):
+        rm = ResultManager(_make_sim_flow())
+        rm.collect(SAMPLE_METADATA)
+        with pytest.raises(ValueError):
+            rm.save(str(tmp_path), history_format='xml')
+
     def test_save_creates_output_dir_if_missing(self, tmp_path):
         new_dir = tmp_path / 'deep' / 'nested'
         rm = ResultManager(_make_sim_flow())
@@ -206,6 +301,7 @@ class TestClassifyEfficiency:
         (90.0, 'Très bon'),    # borne exacte
         (80.0, 'Bon'),         # borne exacte
         (70.0, 'Moyen'),       # borne exacte
+        (float('nan'), 'Insuffisant'),
     ])
     def test_thresholds(self, rm, removal, expected):
         assert rm._classify_efficiency(removal) == expected
@@ -185,15 +185,16 @@ class TestExporters:
 
         assert mock_logger.info.called or mock_logger.debug.called
 
-    @patch('interfaces.result_exporter.json.dump')
+    @patch('core.registries.export.strategies.json_strategy._dumps', return_value=b'{}')
     def test_export_to_json_writes_file(self, mock_dump):
         """Test : export_to_json écrit le fichier"""
         results = {'metadata': {}, 'history': {}}
 
-        with patch('builtins.open', MagicMock()):
+        with patch('builtins.open', MagicMock()) as mock_open_file:
             ResultsExporter.export_to_json(results, 'output.json')
 
-        mock_dump.assert_called_once()
+        mock_dump.assert_called_once_with(results)
+        mock_open_file.return_value.__enter__.return_value.write.assert_called_once_with(b'{}')
 
 class TestExportersEdgeCases:
     """Tests de cas limites"""
@@ -157,6 +157,28 @@ class TestASM1Fraction:
         for key, value in components.items():
             assert value >= 0, f"{key} est négatif: {value}"
 
+    def test_dict_keeps_key_order_and_types(self):
+        """Test : fractionate garde l'ordre des clés et snh tel que fourni"""
+        components = ASM1Fraction.fractionate(cod=500.0, tss=250.0, nh4=28)
+
+        assert list(components) == [
+            'si', 'ss', 'xi', 'xbh', 'xba', 'xs', 'xp',
+            'snh', 'snd', 'xnd', 'sno', 'so', 'salk'
+        ]
+        assert components['snh'] == 28
+        assert isinstance(components['snh'], int)
+
+    def test_array_matches_dict(self):
+        """Test : fractionate_array suit le schéma COMPONENTS"""
+        kwargs = dict(cod=500.0, tss=250.0, tkn=40.0, nh4=28.0, no3=0.5)
+        values = ASM1Fraction.fractionate_array(**kwargs)
+        components = ASM1Fraction.fractionate(**kwargs)
+
+        assert values.shape == (len(ASM1Fraction.COMPONENTS),)
+        assert set(components) == set(ASM1Fraction.COMPONENTS)
+        for name, idx in ASM1Fraction.INDEX.items():
+            assert values[idx] == pytest.approx(components[name])
+
 
 class TestASM2DFraction:
     """Tests pour ASM2DFraction"""
@@ -467,4 +467,161 @@ class TestProcessNode:
             mock_registry.fractionate.assert_called_once()
 
             call_args = mock_registry.fractionate.call_args.kwargs
-            assert call_args['tss'] == 0.0
\ No newline at end of file
+            assert call_args['tss'] == 0.0
+
+    def test_connections_deduplicated_in_order(self):
+        """Test : les connexions sont dédoublonnées et gardent l'ordre d'ajout"""
+        from core.process.process_node import ProcessNode
+
+        class TestProcess(ProcessNode):
+            def initialize(self) -> None:
+                pass
+
+            def process(self, inputs, dt: float):
+                return {}
+
+            def update_state(self, outputs) -> None:
+                pass
+
+            def get_required_inputs(self) -> List[str]:
+                return []
+
+        process = TestProcess('test', 'test', {})
+        for node_id in ['b', 'a', 'b', 'c', 'a']:
+            process.connect_upstream(node_id)
+            process.connect_downstream(node_id)
+
+        assert process.upstream_nodes == ('b', 'a', 'c')
+        assert process.downstream_nodes == ('b', 'a', 'c')
+
+        with pytest.raises(AttributeError):
+            process.upstream_nodes.append('d')
+        assert process.upstream_nodes == ('b', 'a', 'c')
+
+    def test_getters_return_read_only_views(self):
+        """Test : get_outputs/get_state/get_metrics exposent des vues sans copie"""
+        from core.process.process_node import ProcessNode
+
+        class TestProcess(ProcessNode):
+            def initialize(self) -> None:
+                pass
+
+            def process(self, inputs, dt: float):
+                return {}
+
+            def update_state(self, outputs) -> None:
+                pass
+
+            def get_required_inputs(self) -> List[str]:
+                return []
+
+        process = TestProcess('test', 'test', {})
+        outputs = process.get_outputs()
+        process.outputs['flowrate'] = 1000.0
+        assert outputs['flowrate'] == 1000.0
+
+        with pytest.raises(TypeError):
+            outputs['flowrate'] = 0.0
+
+        process.state = {'so': 2.0}
+        process.metrics = {'cod_removal': 0.9}
+        assert dict(process.get_state()) == {'so': 2.0}
+        assert dict(process.get_metrics()) == {'cod_removal': 0.9}
+
+    def test_validate_inputs_caches_required_keys_per_class(self):
+        """Test : les clés requises sont lues une fois par classe"""
+        from core.process.process_node import ProcessNode
+
+        class TestProcess(ProcessNode):
+            calls = 0
+
+            def initialize(self) -> None:
+                pass
+
+            def process(self, inputs, dt: float):
+                return {}
+
+            def update_state(self, outputs) -> None:
+                pass
+
+            def get_required_inputs(self) -> List[str]:
+                TestProcess.calls += 1
+                return ['flow', 'flowrate']
+
+        class OtherProcess(TestProcess):
+            def get_required_inputs(self) -> List[str]:
+                return ['components']
+
+        first = TestProcess('p1', 'p1', {})
+        second = TestProcess('p2', 'p2', {})
+
+        assert first.validate_inputs({'flow': object(), 'flowrate': 1.0, 'extra': None})
+        assert not second.validate_inputs({'flow': object()})
+        assert not second.validate_inputs({'flow': object(), 'flowrate': None})
+        assert TestProcess.calls == 1
+
+        other = OtherProcess('p3', 'p3', {})
+        assert other.validate_inputs({'components': {}})
+        assert not other.validate_inputs({'flow': object(), 'flowrate': 1.0})
+
+    def test_nodes_share_module_logger(self, caplog):
+        """Test : un logger commun, messages préfixés par l'ID du noeud"""
+        import logging
+        from core.process.process_node import ProcessNode
+
+        class TestProcess(ProcessNode):
+            def initialize(self) -> None:
+                pass
+
+            def process(self, inputs, dt: float):
+                return {}
+
+            def update_state(self, outputs) -> None:
+                pass
+
+            def get_required_inputs(self) -> List[str]:
+                return []
+
+        first = TestProcess('n1', 'n1', {})
+        second = TestProcess('n2', 'n2', {})
+        assert first.logger.logger is second.logger.logger
+
+        with caplog.at_level(logging.WARNING, logger='core.process.process_node'):
+            second.logger.warning("Alerte %s", 'DO')
+
+        record = caplog.records[-1]
+        assert record.getMessage() == '[n2] Alerte DO'
+        assert record.node_id == 'n2'
+
+    def test_reset_reruns_initialize(self):
+        """Test : chaque reset relance initialize (tampons ML, recalibration)"""
+        from core.process.process_node import ProcessNode
+
+        class TestProcess(ProcessNode):
+            calls = 0
+
+            def initialize(self) -> None:
+                TestProcess.calls += 1
+                self.state = {'so': self.config['do']}
+                self.sequence_buffer = []
+
+            def process(self, inputs, dt: float):
+                return {}
+
+            def update_state(self, outputs) -> None:
+                pass
+
+            def get_required_inputs(self) -> List[str]:
+                return []
+
+        process = TestProcess('test', 'test', {'do': 2.0})
+        for _ in range(3):
+            process.state['so'] = 0.0
+            process.sequence_buffer = [1.0]
+            process.outputs['flowrate'] = 1.0
+            process.reset()
+
+        assert TestProcess.calls == 3
+        assert process.state == {'so': 2.0}
+        assert process.sequence_buffer == []
+        assert process.outputs == {}
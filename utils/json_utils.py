@@ -0,0 +1,68 @@
+"""
+Encodage / décodage JSON partagé (orjson si disponible, sinon json)
+
+Même rendu que json.dump(indent=2, default=str) : les datetimes et objets
+inconnus passent par str().
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+try:
+    import orjson
+    # Datetimes passés à default=str : même rendu que json.dump(default=str)
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    def dumps(data: Any) -> bytes:
+        """Encode data en JSON indenté (2 espaces)"""
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+
+    def dumps_line(data: Any) -> bytes:
+        """Encode data en JSON sur une seule ligne (NDJSON)"""
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS & ~orjson.OPT_INDENT_2)
+
+    loads = orjson.loads
+except ImportError:
+    def dumps(data: Any) -> bytes:
+        """Encode data en JSON indenté (2 espaces)"""
+        return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+    def dumps_line(data: Any) -> bytes:
+        """Encode data en JSON sur une seule ligne (NDJSON)"""
+        return json.dumps(data, default=str).encode('utf-8')
+
+    loads = json.loads
+
+
+T = TypeVar('T')
+
+# Fichiers json de catalogue gardés en mémoire (quelques dizaines au plus)
+_FILE_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=_FILE_CACHE_SIZE)
+def read_json_cached(path: Path, mtime_ns: int) -> Any:
+    """Lit un fichier json ; le cache est invalidé si le fichier est modifié"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def load_json_cached(path: Path) -> Any:
+    """
+    Retourne le contenu json de path, partagé entre les appelants
+
+    Le résultat ne doit pas être modifié par l'appelant.
+    """
+    return read_json_cached(path, path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=_FILE_CACHE_SIZE)
+def read_definition_cached(from_dict: Callable[[Any], T], path: Path, mtime_ns: int) -> T:
+    """Construit from_dict(contenu de path), partagé tant que le fichier est inchangé"""
+    return from_dict(read_json_cached(path, mtime_ns))